@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+Solve many puzzle inputs for one solver, spread across a pool of worker processes.
+
+Inputs are either every file in a directory matching a pattern, or the files listed in a manifest (one path per line,
+relative to the manifest, with blank lines and lines starting with # ignored). Each worker imports the solver once and
+then solves inputs back to back. Results are streamed to stdout as JSON lines as soon as each input completes. Answers
+come from the answer cache where possible, unless --no-cache is given.
+
+    python -m aoc.batch day_09.part_b generated/day_09/
+    python -m aoc.batch day_15.part_a inputs.manifest --option target_y=2000000 --jobs 8
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from aoc import solvers
+from aoc.cache import cached_solve
+from aoc.reader import read_file
+
+
+def input_paths(location: Path, pattern: str = '*.txt') -> List[Path]:
+    if location.is_dir():
+        return sorted(path for path in location.glob(pattern) if path.is_file())
+
+    paths = []
+    for line in location.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        paths.append(location.parent / line)
+    return paths
+
+
+def _load_solver(solver: str):
+    # Import in the pool initializer so each worker pays for its imports once rather than per input
+    solvers.get_solver(solver)
+
+
+def solve_file(solver: str, path: Path, options: Dict[str, Any], use_cache: bool = False) -> Dict[str, Any]:
+    result = {'input': str(path), 'answer': None, 'seconds': None, 'error': None}
+    try:
+        puzzle_input = read_file(path)
+        start = time.perf_counter()
+        if use_cache:
+            answer = cached_solve(solver, puzzle_input, **options)
+        else:
+            answer = solvers.solve(solver, puzzle_input, **options)
+        result['seconds'] = time.perf_counter() - start
+        result['answer'] = answer if isinstance(answer, (int, str)) else str(answer)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def solve_all(
+        solver: str,
+        paths: List[Path],
+        options: Dict[str, Any],
+        jobs: Optional[int] = None,
+        use_cache: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the result for each input as it completes, which is not necessarily the order they were given in.
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_load_solver,
+            initargs=(solver,)) as executor:
+        futures = [executor.submit(solve_file, solver, path, options, use_cache) for path in paths]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('solver', help='solver to run, e.g. day_09.part_b')
+    parser.add_argument('inputs', type=Path, help='directory of inputs, or a manifest listing them')
+    parser.add_argument('--pattern', default='*.txt', help='files to solve when given a directory')
+    parser.add_argument('--option', action='append', default=[], type=solvers.parse_option, metavar='NAME=VALUE',
+                        help='keyword argument passed to solve() for every input')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='number of worker processes')
+    parser.add_argument('--no-cache', action='store_true', help='solve every input even if its answer is cached')
+    args = parser.parse_args()
+
+    # Fail fast on an unknown solver rather than once per input in the workers
+    if args.solver not in solvers.solver_names():
+        parser.error(f"unknown solver {args.solver}, expected one of {', '.join(solvers.solver_names())}")
+
+    paths = input_paths(args.inputs, args.pattern)
+    errors = 0
+    start = time.perf_counter()
+    for result in solve_all(args.solver, paths, dict(args.option), args.jobs, use_cache=not args.no_cache):
+        errors += result['error'] is not None
+        print(json.dumps(result), flush=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"Solved {len(paths) - errors} of {len(paths)} inputs in {elapsed:.2f}s", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark every day_XX solver against its example.txt and input.txt.
+
+Each solver is run several times in a fresh interpreter (cold runs, which pay for interpreter start-up and imports) and
+several times inside this process through solve() after a warm-up run (warm runs). A final traced run records the
+peak memory allocated, and roughly how many blocks were allocated at that peak. The results are written to a JSON
+report, and optionally compared against a previous report used as a baseline.
+
+Passing --sizes also runs each solver on inputs of those sizes from its day's generator (see aoc.generate), so that
+runtime can be plotted against input size.
+
+    python -m aoc.benchmark --days 5 8 --output benchmark.json
+    python -m aoc.benchmark --baseline benchmark.json --output benchmark_new.json
+    python -m aoc.benchmark --days 20 --inputs --sizes 1000 10000 100000 --warm-runs 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aoc import profiling, solvers
+from aoc.generate import generate, generator_days
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INPUT_FILENAMES = ['example.txt', 'input.txt']
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+# Slowdowns smaller than this many seconds are noise, however large they are as a fraction of a very short run
+DEFAULT_MINIMUM_SLOWDOWN = 0.01
+
+# Some solvers take puzzle parameters that aren't in the input file. These are passed to solve() as keyword arguments,
+# and on the command line in the same order.
+SOLVER_OPTIONS = {
+    ('day_15.part_a', 'example.txt'): {'target_y': 10},
+    ('day_15.part_a', 'input.txt'): {'target_y': 2_000_000},
+    ('day_15.part_b', 'example.txt'): {'max_coord': 20},
+    ('day_15.part_b', 'input.txt'): {'max_coord': 4_000_000},
+}
+
+
+@dataclass
+class Timings:
+    wall_seconds: List[float] = field(default_factory=list)
+    max_rss_kb: Optional[int] = None
+
+    def summary(self) -> Dict[str, float]:
+        if not self.wall_seconds:
+            return {}
+        return {
+            'min': min(self.wall_seconds),
+            'median': statistics.median(self.wall_seconds),
+            'max': max(self.wall_seconds),
+        }
+
+
+@dataclass
+class Result:
+    solver: str
+    input: str
+    status: str = 'ok'
+    answer: Optional[str] = None
+    error: Optional[str] = None
+    cold: Timings = field(default_factory=Timings)
+    warm: Timings = field(default_factory=Timings)
+    allocated_peak_bytes: Optional[int] = None
+    # Memory blocks in use when the traced run's memory use was near its peak
+    allocated_peak_blocks: Optional[int] = None
+    size: Optional[int] = None
+
+    @property
+    def key(self):
+        return self.solver, self.input
+
+    def to_json(self) -> dict:
+        result = asdict(self)
+        result['cold']['summary'] = self.cold.summary()
+        result['warm']['summary'] = self.warm.summary()
+        return result
+
+
+def select_solvers(days: Optional[List[int]] = None, parts: Optional[List[str]] = None) -> List[str]:
+    return [
+        name for name in solvers.solver_names()
+        if (not days or int(name[4:6]) in days) and (not parts or name[-1] in parts)
+    ]
+
+
+def last_line(output: str) -> Optional[str]:
+    lines = output.rstrip('\n').split('\n')
+    return lines[-1] if lines else None
+
+
+# Run by each cold run's interpreter in place of python -m solver. It reports the peak resident set size of the
+# interpreter itself through the file descriptor it is given, as the parent's view of a child's resource usage on Linux
+# starts from the high-water mark of the parent that forked it.
+COLD_RUN_SCRIPT = """
+import atexit, os, resource, runpy, sys
+
+def report_peak_rss(descriptor=int(sys.argv[1])):
+    peak_rss_kb = None
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    peak_rss_kb = int(line.split()[1])
+    except OSError:
+        # Without /proc, as on macOS, which reports bytes rather than kilobytes
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    os.write(descriptor, str(peak_rss_kb).encode())
+    os.close(descriptor)
+
+atexit.register(report_peak_rss)
+sys.argv = sys.argv[2:]
+runpy.run_module(sys.argv[0], run_name='__main__', alter_sys=True)
+"""
+
+
+def cold_run(
+        solver: str,
+        input_path: Path,
+        arguments: List[str],
+        timeout: Optional[float]) -> (float, Optional[int], str):
+    """
+    Run the solver in a fresh interpreter, returning wall time, peak RSS in KB and standard output. The peak RSS is
+    None if the interpreter didn't get as far as reporting it.
+    """
+    read_descriptor, write_descriptor = os.pipe()
+    with open(input_path, 'rb') as stdin, tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                [sys.executable, '-c', COLD_RUN_SCRIPT, str(write_descriptor), solver, *arguments],
+                cwd=REPO_ROOT,
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+                pass_fds=(write_descriptor,),
+            )
+        finally:
+            os.close(write_descriptor)
+        timer = threading.Timer(timeout, process.kill) if timeout else None
+        if timer:
+            timer.start()
+        process.wait()
+        elapsed = time.perf_counter() - start
+        if timer:
+            timer.cancel()
+        with os.fdopen(read_descriptor) as peak_rss:
+            reported_rss = peak_rss.read()
+
+        stdout.seek(0)
+        stderr.seek(0)
+        output, errors = stdout.read(), stderr.read()
+
+    if timeout and elapsed >= timeout and process.returncode < 0:
+        raise subprocess.TimeoutExpired(solver, timeout)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, solver, output, errors)
+    max_rss_kb = int(reported_rss) if reported_rss not in ('', 'None') else None
+    return elapsed, max_rss_kb, output.decode()
+
+
+def warm_run(solver: str, input_text: str, options: Dict[str, Any]) -> (float, Any):
+    """
+    Run the solver in this process, with its imports already loaded by a previous run.
+    """
+    solve = solvers.get_solver(solver)
+    start = time.perf_counter()
+    answer = solve(input_text, **options)
+    return time.perf_counter() - start, answer
+
+
+def traced_run(
+        solver: str,
+        input_text: str,
+        options: Dict[str, Any],
+        interval: float = profiling.DEFAULT_INTERVALS['tracemalloc']) -> (int, int):
+    """
+    Run the solver with tracemalloc, returning the peak bytes allocated and the number of blocks allocated near that
+    peak. The peak in bytes is exact, but the blocks are counted by polling every interval seconds, taking a snapshot
+    whenever memory use has grown, as aoc.profiling does.
+    """
+    peak = {'bytes': 0, 'blocks': 0}
+
+    def count_blocks():
+        current, _peak = tracemalloc.get_traced_memory()
+        if current > peak['bytes'] * profiling.SNAPSHOT_GROWTH:
+            peak['bytes'] = current
+            peak['blocks'] = len(tracemalloc.take_snapshot().traces)
+
+    tracemalloc.start()
+    try:
+        profiling.run_with_poller(lambda: warm_run(solver, input_text, options), interval, count_blocks)
+        # Short solvers may finish before the first poll
+        count_blocks()
+        _current, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_bytes, peak['blocks']
+
+
+def generated_input_path(directory: Path, day: str, size: int, seed: int) -> Path:
+    """
+    Write the generated input for this day and size into the directory, unless an earlier solver already has.
+    """
+    input_path = directory / day / f"generated_{size}.txt"
+    if not input_path.exists():
+        input_path.parent.mkdir(exist_ok=True)
+        input_path.write_text(generate(day, size, seed))
+    return input_path
+
+
+def benchmark(
+        solver: str,
+        input_path: Path,
+        cold_runs: int,
+        warm_runs: int,
+        timeout: Optional[float],
+        size: Optional[int] = None) -> Result:
+    result = Result(solver=solver, input=input_path.name, size=size)
+    # Generated inputs are built at the scale of the real input, so they take the same options
+    options = SOLVER_OPTIONS.get((solver, 'input.txt' if size is not None else input_path.name), {})
+    arguments = [str(value) for value in options.values()]
+
+    try:
+        for _ in range(cold_runs):
+            elapsed, max_rss_kb, output = cold_run(solver, input_path, arguments, timeout)
+            result.cold.wall_seconds.append(elapsed)
+            if max_rss_kb is not None:
+                result.cold.max_rss_kb = max(result.cold.max_rss_kb or 0, max_rss_kb)
+            result.answer = output.rstrip('\n')
+    except subprocess.TimeoutExpired:
+        result.status = 'timeout'
+        return result
+    except subprocess.CalledProcessError as e:
+        result.status = 'error'
+        result.error = last_line(e.stderr.decode())
+        return result
+
+    if not warm_runs:
+        return result
+
+    input_text = input_path.read_text()
+    warm_run(solver, input_text, options)
+    for _ in range(warm_runs):
+        elapsed, _answer = warm_run(solver, input_text, options)
+        result.warm.wall_seconds.append(elapsed)
+    result.allocated_peak_bytes, result.allocated_peak_blocks = traced_run(solver, input_text, options)
+    return result
+
+
+def compare(
+        results: List[Result],
+        baseline: dict,
+        threshold: float,
+        minimum_slowdown: float = DEFAULT_MINIMUM_SLOWDOWN) -> List[str]:
+    """
+    Compare against a baseline report, returning a description of each regression found. A solver only counts as
+    slower if its fastest run slowed down by more than the threshold, as a fraction, and by more than minimum_slowdown
+    seconds.
+    """
+    baseline_results = {(r['solver'], r['input']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        previous = baseline_results.get(result.key)
+        if previous is None or result.status != 'ok':
+            continue
+
+        if previous['answer'] != result.answer:
+            regressions.append(
+                f"{result.solver} {result.input}: answer changed from {previous['answer']} to {result.answer}"
+            )
+
+        for mode in ['warm', 'cold']:
+            # The fastest run is the one least disturbed by whatever else the machine was doing
+            previous_min = previous[mode]['summary'].get('min')
+            current_min = getattr(result, mode).summary().get('min')
+            if not previous_min or current_min is None:
+                continue
+            ratio = current_min / previous_min
+            if ratio > 1 + threshold and current_min - previous_min > minimum_slowdown:
+                regressions.append(
+                    f"{result.solver} {result.input}: {mode} min {previous_min:.4f}s -> {current_min:.4f}s "
+                    f"({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def format_result(result: Result) -> str:
+    if result.status != 'ok':
+        return f"{result.solver:<14} {result.input:<20} {result.status} {result.error or ''}"
+    cold = result.cold.summary().get('median', 0)
+    warm = result.warm.summary().get('median')
+    warm = f"{warm:9.4f}s" if warm is not None else f"{'-':>10}"
+    return f"{result.solver:<14} {result.input:<20} cold {cold:9.4f}s warm {warm} rss {result.cold.max_rss_kb}KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--days', type=int, nargs='+', help='only benchmark these days')
+    parser.add_argument('--parts', nargs='+', choices=['a', 'b'], help='only benchmark these parts')
+    parser.add_argument('--inputs', nargs='*', default=INPUT_FILENAMES, help='input files to run each solver on')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[], help='also run each solver on generated inputs')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated inputs')
+    parser.add_argument('--cold-runs', type=int, default=3, help='runs in a fresh interpreter')
+    parser.add_argument('--warm-runs', type=int, default=3, help='in-process runs after a warm-up run')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds before a cold run is abandoned')
+    parser.add_argument('--output', type=Path, default=Path('benchmark.json'), help='where to write the report')
+    parser.add_argument('--baseline', type=Path, help='previous report to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='fractional slowdown against the baseline counted as a regression')
+    parser.add_argument('--min-slowdown', type=float, default=DEFAULT_MINIMUM_SLOWDOWN,
+                        help='seconds a run must slow down by, as well as the threshold, to count as a regression')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as generated_directory:
+        for solver in select_solvers(args.days, args.parts):
+            day = solver.split('.')[0]
+            for input_filename in args.inputs:
+                input_path = REPO_ROOT / day / input_filename
+                if not input_path.exists():
+                    continue
+                result = benchmark(solver, input_path, args.cold_runs, args.warm_runs, args.timeout)
+                print(format_result(result), file=sys.stderr)
+                results.append(result)
+
+            if day not in generator_days():
+                continue
+            for size in args.sizes:
+                input_path = generated_input_path(Path(generated_directory), day, size, args.seed)
+                result = benchmark(solver, input_path, args.cold_runs, args.warm_runs, args.timeout, size)
+                print(format_result(result), file=sys.stderr)
+                results.append(result)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'cold_runs': args.cold_runs,
+        'warm_runs': args.warm_runs,
+        'seed': args.seed,
+        'results': [result.to_json() for result in results],
+    }
+    args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold, args.min_slowdown)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
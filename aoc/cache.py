@@ -0,0 +1,168 @@
+"""
+On-disk cache of solver answers, so that re-running a solver on an unchanged input costs nothing.
+
+Answers are keyed by the solver's name, a hash of the source of its day package, a hash of the puzzle input and the
+options passed to solve(). Changing the solver's code or its input therefore misses the cache. Each answer is a small
+JSON file. Hits refresh the file's modification time, and once the cache grows past its size limit the least recently
+used answers are evicted, down to a fraction of the limit so that the cache directory is scanned only now and then.
+
+Set AOC_NO_CACHE=1 in the environment to bypass the cache, or AOC_CACHE_DIR to move it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc import reader, solvers
+from aoc.reader import PuzzleInput, read_text
+
+DEFAULT_CACHE_DIRECTORY = solvers.REPO_ROOT / '.answer_cache'
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+# Eviction empties the cache down to this fraction of its limit, so that the next few writes don't evict again
+EVICTION_TARGET = 0.9
+# Other processes may be writing to the same cache, so its size is recounted from the directory after this many writes
+RESCAN_INTERVAL = 1000
+
+
+@lru_cache(maxsize=None)
+def source_hash(solver: str) -> str:
+    """
+    Hash of every Python file in the solver's day package and of the shared input reader, so that changes to helper
+    modules also miss the cache.
+    """
+    digest = hashlib.sha256()
+    day_directory = solvers.REPO_ROOT / solver.split('.')[0]
+    for path in [*sorted(day_directory.glob('*.py')), Path(reader.__file__)]:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(solver: str, puzzle_text: str, options: Dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    digest.update(solver.encode())
+    digest.update(source_hash(solver).encode())
+    digest.update(hashlib.sha256(puzzle_text.encode()).digest())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def default_cache_directory() -> Path:
+    return Path(os.environ.get('AOC_CACHE_DIR', DEFAULT_CACHE_DIRECTORY))
+
+
+def cache_disabled() -> bool:
+    return os.environ.get('AOC_NO_CACHE', '') not in ('', '0')
+
+
+@dataclass
+class AnswerCache:
+    directory: Path = field(default_factory=default_cache_directory)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    # The size of the cache as of the last scan, plus what has been written since, or None before the first scan
+    _total_bytes: Optional[int] = field(default=None, init=False, repr=False)
+    _writes_since_scan: int = field(default=0, init=False, repr=False)
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.path_for(key)
+        try:
+            entry = json.loads(path.read_text())
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so that concurrent workers never see a partly written entry
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'w') as file:
+            json.dump(entry, file)
+            size = file.tell()
+        os.replace(temporary_path, self.path_for(key))
+
+        self._writes_since_scan += 1
+        if self._total_bytes is None or self._writes_since_scan >= RESCAN_INTERVAL:
+            self.scan()
+        else:
+            # Overwriting an entry counts its size twice, which at worst brings the next eviction forward
+            self._total_bytes += size
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def scan(self) -> List[Tuple[float, int, str]]:
+        """
+        The modification time, size and path of every entry, oldest first, recounting the size of the cache.
+        """
+        entries = []
+        with os.scandir(self.directory) as scanned:
+            for entry in scanned:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        self._total_bytes = sum(size for _modified, size, _path in entries)
+        self._writes_since_scan = 0
+        return sorted(entries)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits within EVICTION_TARGET of max_bytes.
+        """
+        entries = self.scan()
+        total_bytes = self._total_bytes
+        for _modified, size, path in entries:
+            if total_bytes <= self.max_bytes * EVICTION_TARGET:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+        self._total_bytes = total_bytes
+
+    def clear(self) -> None:
+        for path in self.directory.glob('*.json'):
+            path.unlink(missing_ok=True)
+        self._total_bytes = None
+
+
+def cached_solve(
+        solver: str,
+        puzzle_input: PuzzleInput,
+        cache: Optional[AnswerCache] = None,
+        **options) -> Any:
+    """
+    Solve the puzzle, returning the stored answer if this solver's current source has already solved this input.
+    Passing cache=None uses the default cache, unless AOC_NO_CACHE is set.
+    """
+    if cache is None:
+        if cache_disabled():
+            return solvers.solve(solver, puzzle_input, **options)
+        cache = AnswerCache()
+
+    puzzle_text = read_text(puzzle_input)
+    key = cache_key(solver, puzzle_text, options)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry['answer']
+
+    start = time.perf_counter()
+    answer = solvers.solve(solver, puzzle_text, **options)
+    elapsed = time.perf_counter() - start
+    # Only answers that survive a round trip through JSON unchanged can be cached
+    if isinstance(answer, (int, str)):
+        cache.put(key, {'solver': solver, 'answer': answer, 'seconds': elapsed})
+    return answer
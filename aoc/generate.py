@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Generate a synthetic puzzle input of a given size, to see how the solvers scale.
+
+    python -m aoc.generate day_08 5000 > /tmp/day_08_5000.txt
+    python -m aoc.generate day_20 100000 --seed 3 --option max_value=1000000
+
+Each day_XX package that supports this has a generate module with a generate(size, seed, **options) function. What
+size counts depends on the day: moves for day_05, the side of the tree grid for day_08, numbers for day_20 and so on.
+The same size and seed always produce the same input.
+"""
+
+import argparse
+import importlib
+import sys
+from functools import lru_cache
+from typing import List
+
+from aoc import solvers
+
+
+@lru_cache(maxsize=None)
+def generator_days() -> List[str]:
+    return sorted(path.parent.name for path in solvers.REPO_ROOT.glob('day_[0-9][0-9]/generate.py'))
+
+
+def generate(day: str, size: int, seed: int = 0, **options) -> str:
+    if day not in generator_days():
+        raise KeyError(f"No generator for {day}")
+    module = importlib.import_module(f"{day}.generate")
+    return module.generate(size, seed=seed, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('day', help='day to generate an input for, e.g. day_08')
+    parser.add_argument('size', type=int, help='how large an input to generate')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the random number generator')
+    parser.add_argument('--option', action='append', default=[], type=solvers.parse_option, metavar='NAME=VALUE',
+                        help='keyword argument passed to generate()')
+    args = parser.parse_args()
+
+    if args.day not in generator_days():
+        parser.error(f"no generator for {args.day}, expected one of {', '.join(generator_days())}")
+
+    sys.stdout.write(generate(args.day, args.size, args.seed, **dict(args.option)))
+
+
+if __name__ == '__main__':
+    main()
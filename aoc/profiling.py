@@ -0,0 +1,265 @@
+"""
+Profile a solver without editing it, with one of three profilers:
+
+- cprofile: deterministic profiling of every call with cProfile, weighted in seconds. cProfile only records which
+  function called which, so a function's time is shared out between its callers' stacks in proportion to the time
+  spent under each caller. Only the thread that calls the solver is profiled.
+- sample: a background thread records the solver's stack every interval seconds, weighted in samples, along with the
+  stacks of any threads the solver starts. This costs far less than cProfile and its stacks are exact, but short
+  functions can be missed.
+- tracemalloc: the memory allocated by the solver and still in use when its memory use was at its highest, weighted in
+  bytes. The memory in use is checked every interval seconds, so the peak found is approximate. Frames are source
+  lines rather than functions, since that is all tracemalloc records. Tracing allocations slows most solvers down
+  several times, and far more when they allocate from many threads at once.
+
+Whichever is used, the result is a set of stacks with a weight each. These can be written in the collapsed format read
+by flamegraph.pl and speedscope, one stack per line with its frames separated by semicolons, or summarised as the
+heaviest frames.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+from aoc import solvers
+
+PROFILERS = ['cprofile', 'sample', 'tracemalloc']
+DEFAULT_INTERVALS = {
+    'sample': 0.001,
+    'tracemalloc': 0.01,
+}
+# Taking a tracemalloc snapshot is slow, so one is only taken once memory use has grown this much past the last one
+SNAPSHOT_GROWTH = 1.1
+
+Stack = Tuple[str, ...]
+
+
+@dataclass
+class Profile:
+    profiler: str
+    unit: str
+    answer: Any = None
+    stacks: Dict[Stack, float] = field(default_factory=Counter)
+
+    def write_collapsed(self, file: TextIO) -> None:
+        # Collapsed stacks need whole number weights, so seconds are written as microseconds
+        scale = 1_000_000 if self.unit == 'seconds' else 1
+        for stack, weight in sorted(self.stacks.items()):
+            weight = round(weight * scale)
+            if weight > 0:
+                file.write(f"{';'.join(stack)} {weight}\n")
+
+    def top(self, count: int) -> List[Tuple[str, float, float]]:
+        """
+        The frames with the highest self weight, each with its self and total weight. Self weight is only that at the
+        top of a stack, whereas total weight includes everything the frame called.
+        """
+        self_weights = Counter()
+        total_weights = Counter()
+        for stack, weight in self.stacks.items():
+            self_weights[stack[-1]] += weight
+            for frame in set(stack):
+                total_weights[frame] += weight
+        return [(frame, weight, total_weights[frame]) for frame, weight in self_weights.most_common(count)]
+
+    def format_top(self, count: int) -> str:
+        total = sum(self.stacks.values()) or 1
+        rows = [f"{'self':>12} {'%':>6} {'total':>12} {'%':>6}  {self.profiler} ({self.unit})"]
+        for frame, self_weight, total_weight in self.top(count):
+            rows.append(
+                f"{self_weight:12.6g} {100 * self_weight / total:6.2f} "
+                f"{total_weight:12.6g} {100 * total_weight / total:6.2f}  {frame}"
+            )
+        return '\n'.join(rows)
+
+
+def describe_location(filename: str) -> str:
+    path = Path(filename)
+    try:
+        return str(path.resolve().relative_to(solvers.REPO_ROOT))
+    except ValueError:
+        return path.name
+
+
+def describe_code(filename: str, line_number: int, name: str) -> str:
+    # Built in functions have no source
+    if filename == '~':
+        return name
+    return f"{name} ({describe_location(filename)}:{line_number})"
+
+
+def describe_line(filename: str, line_number: int) -> str:
+    return f"{describe_location(filename)}:{line_number}"
+
+
+def profile_cprofile(function: Callable[[], Any]) -> Profile:
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(function)
+    stats = pstats.Stats(profiler).stats
+
+    # Share each function's time out between its callers, in proportion to the cumulative time of each call site
+    callees: Dict[Any, List[Any]] = {key: [] for key in stats}
+    for key, (_calls, _primitive_calls, _own_time, _cumulative_time, callers) in stats.items():
+        for caller in callers:
+            if caller in callees:
+                callees[caller].append(key)
+    roots = [key for key, statistics in stats.items() if not any(caller in stats for caller in statistics[4])]
+
+    result = Profile(profiler='cprofile', unit='seconds', answer=answer)
+
+    def visit(key, stack: Stack, fraction: float):
+        filename, _line_number, name = key
+        # Leave out the profiler's own frames, including its call to disable itself
+        if filename != __file__ and not name.startswith("<method 'disable' of '_lsprof"):
+            stack = stack + (describe_code(*key),)
+            result.stacks[stack] += stats[key][2] * fraction
+        for callee in callees[key]:
+            callee_cumulative_time = stats[callee][3]
+            # Recursive calls are already counted in the cumulative time of the outermost call
+            if describe_code(*callee) in stack or not callee_cumulative_time:
+                continue
+            call_site_cumulative_time = stats[callee][4][key][3]
+            visit(callee, stack, fraction * min(1.0, call_site_cumulative_time / callee_cumulative_time))
+
+    for root in roots:
+        visit(root, (), 1.0)
+    return result
+
+
+def function_stack(frame, function: Optional[Callable[[], Any]]) -> Optional[Stack]:
+    """
+    The stack of a frame, outermost first, starting from the profiled function. Frames from anywhere else, such as the
+    profiler waiting for its thread, give None. Without a function, the whole stack is given.
+    """
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        if function is not None and code is function.__code__:
+            # The profiler wraps each solver in a function of its own, which isn't worth showing
+            if code.co_filename != __file__:
+                stack.append(describe_code(code.co_filename, code.co_firstlineno, code.co_name))
+            return tuple(reversed(stack)) or None
+        stack.append(describe_code(code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    if function is None:
+        return tuple(reversed(stack)) or None
+    return None
+
+
+def run_with_poller(function: Callable[[], Any], interval: float, poll: Callable[[], None]) -> Any:
+    """
+    Call the function, calling poll from another thread every interval seconds while it runs.
+    """
+    stopped = threading.Event()
+
+    def poller():
+        while not stopped.wait(interval):
+            poll()
+
+    # The poller can only run when the solver gives up the interpreter lock, so ask it to do so as often as we poll
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    thread = threading.Thread(target=poller, daemon=True)
+    thread.start()
+    try:
+        return function()
+    finally:
+        stopped.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+
+
+def profile_sample(function: Callable[[], Any], interval: float = DEFAULT_INTERVALS['sample']) -> Profile:
+    result = Profile(profiler='sample', unit='samples')
+    thread_id = threading.get_ident()
+    existing_thread_ids = set(sys._current_frames())
+
+    def sample():
+        for sampled_thread_id, frame in sys._current_frames().items():
+            if sampled_thread_id == thread_id:
+                stack = function_stack(frame, function)
+            elif sampled_thread_id not in existing_thread_ids and sampled_thread_id != threading.get_ident():
+                # Threads started by the solver are sampled from the start of the thread
+                stack = function_stack(frame, None)
+            else:
+                continue
+            if stack:
+                result.stacks[stack] += 1
+
+    result.answer = run_with_poller(function, interval, sample)
+    return result
+
+
+def profile_tracemalloc(
+        function: Callable[[], Any],
+        interval: float = DEFAULT_INTERVALS['tracemalloc'],
+        frames: int = 64) -> Profile:
+    result = Profile(profiler='tracemalloc', unit='bytes')
+    peak = {'bytes': 0, 'snapshot': None}
+
+    def take_snapshot():
+        current, _peak = tracemalloc.get_traced_memory()
+        if current > peak['bytes'] * SNAPSHOT_GROWTH:
+            peak['bytes'] = current
+            peak['snapshot'] = tracemalloc.take_snapshot()
+
+    tracemalloc.start(frames)
+    try:
+        result.answer = run_with_poller(function, interval, take_snapshot)
+        # Short solvers may finish before the first poll, and the answer is all that is left of them
+        take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    code = function.__code__
+    function_lines = {line for _start, _end, line in code.co_lines()}
+    for statistic in peak['snapshot'].statistics('traceback'):
+        traceback = list(statistic.traceback)
+        entries = [
+            index for index, frame in enumerate(traceback)
+            if frame.filename == code.co_filename and frame.lineno in function_lines
+        ]
+        if entries:
+            # Start the stack from the profiled function
+            start = entries[-1] + (1 if code.co_filename == __file__ else 0)
+        elif any(frame.filename == __file__ for frame in traceback):
+            # Allocated by the profiler itself
+            continue
+        else:
+            # Allocated by a thread the solver started, or so deep in the solver that the traceback was cut short
+            start = 0
+        stack = tuple(describe_line(frame.filename, frame.lineno) for frame in traceback[start:])
+        if stack:
+            result.stacks[stack] += statistic.size
+    return result
+
+
+def profile(
+        solver: str,
+        puzzle_input: Any,
+        profiler: str = 'sample',
+        interval: Optional[float] = None,
+        **options) -> Profile:
+    """
+    Solve the puzzle under the given profiler. The interval is how often the sample and tracemalloc profilers look at
+    the solver, in seconds.
+    """
+    solve = solvers.get_solver(solver)
+
+    def function():
+        return solve(puzzle_input, **options)
+
+    if profiler == 'cprofile':
+        return profile_cprofile(function)
+    if profiler not in DEFAULT_INTERVALS:
+        raise ValueError(f"Unexpected profiler {profiler}, expected one of {', '.join(PROFILERS)}")
+    interval = interval or DEFAULT_INTERVALS[profiler]
+    if profiler == 'sample':
+        return profile_sample(function, interval)
+    return profile_tracemalloc(function, interval)
@@ -0,0 +1,138 @@
+"""
+Helpers for reading puzzle input, whether it arrives as text, as a stream such as stdin, or as a path to a file.
+
+The whole input is read in one go and split in a single pass, rather than a line at a time, and the parsers all work
+on the resulting list of lines. Blank lines are kept, so inputs made of several sections can be split with records().
+Inputs too large to hold in memory can instead be read a chunk at a time with chunks(), or a line at a time with
+stream_lines().
+"""
+
+import mmap
+import os
+import re
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+PuzzleInput = Union[str, TextIO, os.PathLike]
+
+INTEGER_PATTERN = re.compile('-?\\d+')
+BLANK_LINES_PATTERN = re.compile('\n{2,}')
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def read_file(path: os.PathLike, use_mmap: bool = True) -> str:
+    """
+    Read a whole file. With mmap the text is decoded straight out of the mapped pages, without first copying the file
+    into a bytes object.
+    """
+    with open(path, 'rb') as file:
+        if not use_mmap or os.fstat(file.fileno()).st_size == 0:
+            return file.read().decode()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
+
+def read_text(puzzle_input: PuzzleInput) -> str:
+    if isinstance(puzzle_input, str):
+        return puzzle_input
+    if isinstance(puzzle_input, os.PathLike):
+        return read_file(puzzle_input)
+    return puzzle_input.read()
+
+
+def chunks(puzzle_input: PuzzleInput, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    The input as consecutive pieces of text of up to size characters, so that only one piece need be in memory.
+    """
+    if isinstance(puzzle_input, str):
+        for start in range(0, len(puzzle_input), size):
+            yield puzzle_input[start:start + size]
+        return
+    if isinstance(puzzle_input, os.PathLike):
+        with open(puzzle_input) as file:
+            yield from chunks(file, size)
+        return
+    while True:
+        chunk = puzzle_input.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_lines(puzzle_input: PuzzleInput, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    The same lines as lines(), read a chunk at a time and produced one by one, so that memory use doesn't grow with
+    the length of the input. Blank lines are kept, except at the end.
+    """
+    partial_line = ''
+    blank_lines = 0
+    for chunk in chunks(puzzle_input, size):
+        *complete_lines, partial_line = (partial_line + chunk).split('\n')
+        for line in complete_lines:
+            # Blank lines are held back until it is known that they aren't at the end
+            if not line:
+                blank_lines += 1
+                continue
+            for _ in range(blank_lines):
+                yield ''
+            blank_lines = 0
+            yield line
+    if partial_line:
+        for _ in range(blank_lines):
+            yield ''
+        yield partial_line
+
+
+def lines(puzzle_input: PuzzleInput) -> List[str]:
+    """
+    All the lines of the input without their line endings, ignoring trailing blank lines.
+    """
+    text = read_text(puzzle_input).rstrip('\n')
+    if not text:
+        return []
+    return text.split('\n')
+
+
+def records(puzzle_input: PuzzleInput) -> List[List[str]]:
+    """
+    The lines of the input grouped into records separated by one or more blank lines.
+    """
+    text = read_text(puzzle_input).strip('\n')
+    if not text:
+        return []
+    return [record.split('\n') for record in BLANK_LINES_PATTERN.split(text)]
+
+
+def ints(puzzle_input: PuzzleInput) -> List[int]:
+    """
+    Every integer in the input, in order, ignoring whatever separates them.
+    """
+    return [int(number) for number in INTEGER_PATTERN.findall(read_text(puzzle_input))]
+
+
+def int_tuples(input_lines: Iterable[str], separator: str = ',') -> List[Tuple[int, ...]]:
+    return [tuple(int(number) for number in line.split(separator)) for line in input_lines]
+
+
+def match_lines(
+        pattern: Union[str, re.Pattern],
+        input_lines: Iterable[str],
+        types: Optional[Union[Callable, Sequence[Callable]]] = None) -> List[Tuple]:
+    """
+    The groups from matching every line in full against the pattern, optionally converted with types. types is either
+    a single callable applied to every group, or one callable per group with None leaving that group as a string.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+
+    matched = []
+    for line in input_lines:
+        match = pattern.fullmatch(line)
+        if not match:
+            raise ValueError(f"Unexpected line {line}")
+        groups = match.groups()
+        if callable(types):
+            groups = tuple(types(group) for group in groups)
+        elif types is not None:
+            groups = tuple(group if convert is None else convert(group) for convert, group in zip(types, groups))
+        matched.append(groups)
+    return matched
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Solve a single puzzle input with any solver, using the answer cache.
+
+    python -m aoc.run day_16.part_b day_16/input.txt
+    python -m aoc.run day_15.part_a --option target_y=2000000 < day_15/input.txt
+
+With --profile the solver is run under a profiler instead (see aoc.profiling), skipping the cache. The heaviest frames
+are printed to stderr, and --flame-graph writes every stack in the collapsed format that flamegraph.pl and speedscope
+read.
+
+    python -m aoc.run day_16.part_a day_16/input.txt --profile sample --flame-graph day_16.collapsed
+    python -m aoc.run day_08.part_b day_08/input.txt --profile tracemalloc --top 10
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from aoc import solvers
+from aoc.cache import AnswerCache, cached_solve
+from aoc.profiling import PROFILERS, profile
+from aoc.reader import read_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('solver', help='solver to run, e.g. day_16.part_b')
+    parser.add_argument('input', type=Path, nargs='?', help='puzzle input file, read from stdin if not given')
+    parser.add_argument('--option', action='append', default=[], type=solvers.parse_option, metavar='NAME=VALUE',
+                        help='keyword argument passed to solve()')
+    parser.add_argument('--no-cache', action='store_true', help='solve even if the answer is cached')
+    parser.add_argument('--clear-cache', action='store_true', help='remove every cached answer first')
+    parser.add_argument('--profile', choices=PROFILERS, help='run the solver under this profiler')
+    parser.add_argument('--interval', type=float, help='seconds between looks at the solver when profiling')
+    parser.add_argument('--top', type=int, default=20, help='how many of the heaviest frames to print when profiling')
+    parser.add_argument('--flame-graph', type=Path, help='where to write the profiled stacks in collapsed format')
+    args = parser.parse_args()
+
+    if args.solver not in solvers.solver_names():
+        parser.error(f"unknown solver {args.solver}, expected one of {', '.join(solvers.solver_names())}")
+
+    if args.clear_cache:
+        AnswerCache().clear()
+
+    puzzle_input = read_file(args.input) if args.input else sys.stdin.read()
+    options = dict(args.option)
+    if args.profile:
+        result = profile(args.solver, puzzle_input, args.profile, args.interval, **options)
+        answer = result.answer
+        print(result.format_top(args.top), file=sys.stderr)
+        if args.flame_graph:
+            with open(args.flame_graph, 'w') as file:
+                result.write_collapsed(file)
+    elif args.no_cache:
+        answer = solvers.solve(args.solver, puzzle_input, **options)
+    else:
+        answer = cached_solve(args.solver, puzzle_input, **options)
+    print(answer)
+
+
+if __name__ == '__main__':
+    main()
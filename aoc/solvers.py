@@ -0,0 +1,51 @@
+"""
+Registry of every day's solvers, so puzzles can be solved in-process by a long-lived worker.
+
+Each day_XX/part_Y.py module exposes solve(puzzle_input, **options), taking the puzzle input as text or as a text
+stream and returning the answer. Solver modules are imported the first time they are used, so that heavyweight
+imports such as numpy are only paid for by the days that need them.
+
+    from aoc import solvers
+    answer = solvers.solve('day_07.part_a', puzzle_text)
+"""
+
+import importlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+from aoc.reader import PuzzleInput
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def solver_names() -> List[str]:
+    names = []
+    for day_directory in sorted(REPO_ROOT.glob('day_[0-9][0-9]')):
+        if not (day_directory / '__init__.py').exists():
+            continue
+        for part_file in sorted(day_directory.glob('part_[a-z].py')):
+            names.append(f"{day_directory.name}.{part_file.stem}")
+    return names
+
+
+def get_solver(name: str) -> Callable[..., Any]:
+    if name not in solver_names():
+        raise KeyError(f"No solver named {name}")
+    return importlib.import_module(name).solve
+
+
+def solve(name: str, puzzle_input: PuzzleInput, **options) -> Any:
+    return get_solver(name)(puzzle_input, **options)
+
+
+def parse_option(option: str) -> Tuple[str, Any]:
+    """
+    Parse a NAME=VALUE command line option for solve(), treating values that look like integers as integers.
+    """
+    name, value = option.split('=', 1)
+    try:
+        return name, int(value)
+    except ValueError:
+        return name, value
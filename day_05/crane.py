@@ -0,0 +1,89 @@
+from typing import List, Tuple
+
+from aoc.reader import PuzzleInput, match_lines, records
+
+MOVE_PATTERN = 'move (\\d+) from (\\d+) to (\\d+)'
+
+Move = Tuple[int, int, int]
+
+
+def read_stacks(drawing: List[str]) -> List[List[str]]:
+    """
+    The stacks in the drawing, each listed from the bottom crate up. Stack 1 is at index 0.
+    """
+    *crate_rows, labels = drawing
+    stacks = [[] for _ in labels.split()]
+    for row in reversed(crate_rows):
+        for index, crate in enumerate(row[1::4]):
+            if crate != ' ':
+                stacks[index].append(crate)
+    return stacks
+
+
+def read_stacks_and_moves(puzzle_input: PuzzleInput) -> Tuple[List[List[str]], List[Move]]:
+    """
+    The stacks in the drawing and the moves after it. A drawing with nothing after it has no moves.
+    """
+    drawing, *move_records = records(puzzle_input)
+    moves = [line for record in move_records for line in record]
+    return read_stacks(drawing), match_lines(MOVE_PATTERN, moves, int)
+
+
+def operate(stacks: List[List[str]], moves: List[Move], keep_order: bool) -> None:
+    """
+    Carry out every move. The CrateMover 9000 lifts one crate at a time, so the crates moved land in reverse order,
+    whereas the CrateMover 9001 (keep_order) lifts them all at once. Either way each move is a single slice of the
+    source stack, so the time taken depends on the number of crates moved rather than on Python overhead per crate.
+    """
+    for crate_count, from_stack, to_stack in moves:
+        source = stacks[from_stack - 1]
+        split = len(source) - crate_count
+        if split < 0:
+            raise ValueError(f"Cannot move {crate_count} crates from stack {from_stack} of {len(source)}")
+        # Moving crates onto the stack they came from leaves it as it was, with either crane
+        if from_stack == to_stack:
+            continue
+        if keep_order:
+            stacks[to_stack - 1] += source[split:]
+        else:
+            stacks[to_stack - 1].extend(reversed(source[split:]))
+        del source[split:]
+
+
+def top_crates(stacks: List[List[str]]) -> str:
+    return ''.join(stack[-1] for stack in stacks if stack)
+
+
+def plan_top_crates(stacks: List[List[str]], moves: List[Move], keep_order: bool) -> str:
+    """
+    The same answer as operate() followed by top_crates(), without moving any crates. Starting from the top of each
+    stack at the end, the moves are undone in reverse to find where each of those crates was in the drawing. Each
+    position is tracked as a stack and a depth below the top, so a move only touches the positions in its own two
+    stacks and the work done doesn't depend on how tall the stacks get. Moves of more crates than a stack holds are not
+    detected.
+    """
+    # For each stack, the depths currently tracked in it and which stack's final top crate each one is
+    tracked = [[(0, index)] for index in range(len(stacks))]
+    for crate_count, from_stack, to_stack in reversed(moves):
+        if from_stack == to_stack:
+            continue
+        source, destination = tracked[from_stack - 1], tracked[to_stack - 1]
+        # Before the move the source also held the crates that were moved
+        restored_source = [(depth + crate_count, final) for depth, final in source]
+        restored_destination = []
+        for depth, final in destination:
+            if depth >= crate_count:
+                restored_destination.append((depth - crate_count, final))
+            elif keep_order:
+                restored_source.append((depth, final))
+            else:
+                restored_source.append((crate_count - 1 - depth, final))
+        tracked[from_stack - 1], tracked[to_stack - 1] = restored_source, restored_destination
+
+    tops = [''] * len(stacks)
+    for stack, positions in zip(stacks, tracked):
+        for depth, final in positions:
+            # Positions below the bottom of the drawing belong to stacks that end up empty
+            if depth < len(stack):
+                tops[final] = stack[-1 - depth]
+    return ''.join(tops)
@@ -0,0 +1,34 @@
+import random
+from math import isqrt
+from string import ascii_uppercase
+from typing import Optional
+
+
+def generate(size: int, seed: int = 0, stacks: int = 9, height: Optional[int] = None) -> str:
+    """
+    A crate drawing with the given number of stacks, followed by size moves. Moves always leave at least one crate
+    behind, so every stack still has a crate on top at the end.
+    """
+    rng = random.Random(seed)
+    if height is None:
+        height = max(8, isqrt(size))
+
+    crate_stacks = [[rng.choice(ascii_uppercase) for _ in range(rng.randint(1, height))] for _ in range(stacks)]
+
+    lines = []
+    for level in reversed(range(max(len(stack) for stack in crate_stacks))):
+        row = [f"[{stack[level]}]" if level < len(stack) else '   ' for stack in crate_stacks]
+        lines.append(' '.join(row))
+    lines.append(' '.join(f" {index + 1} " for index in range(stacks)))
+    lines.append('')
+
+    heights = [len(stack) for stack in crate_stacks]
+    for _ in range(size):
+        from_stack = rng.choice([index for index in range(stacks) if heights[index] > 1])
+        to_stack = rng.choice([index for index in range(stacks) if index != from_stack])
+        crate_count = rng.randint(1, heights[from_stack] - 1)
+        heights[from_stack] -= crate_count
+        heights[to_stack] += crate_count
+        lines.append(f"move {crate_count} from {from_stack + 1} to {to_stack + 1}")
+
+    return '\n'.join(lines) + '\n'
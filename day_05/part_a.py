@@ -1,37 +1,23 @@
-from collections import defaultdict
 import sys
 
+from aoc.reader import PuzzleInput
+from day_05.crane import operate, plan_top_crates, read_stacks_and_moves, top_crates
 
-crate_stacks = defaultdict(list)
 
-while True:
-    line = sys.stdin.readline().strip('\n')
-    if '[' not in line:
-        break
+def solve(puzzle_input: PuzzleInput, lazy: bool = False) -> str:
+    """
+    With lazy set, only the crates that end up on top are traced through the moves, rather than moving every crate.
+    """
+    stacks, moves = read_stacks_and_moves(puzzle_input)
+    if lazy:
+        return plan_top_crates(stacks, moves, keep_order=False)
+    operate(stacks, moves, keep_order=False)
+    return top_crates(stacks)
 
-    for index, crate in enumerate(line[1::4]):
-        if crate == ' ':
-            continue
 
-        crate_stacks[index + 1] = [crate] + crate_stacks[index + 1]
+def main():
+    print(solve(sys.stdin))
 
-while True:
-    line = sys.stdin.readline()
-    if line == '':
-        break
 
-    if not line.startswith('move '):
-        continue
-
-    (_, crate_count, _, from_crate, _, to_crate) = line.strip().split(' ')
-
-    crate_count, from_crate, to_crate = int(crate_count), int(from_crate), int(to_crate)
-
-    for _ in range(crate_count):
-        crate_stacks[to_crate].append(crate_stacks[from_crate].pop())
-
-result = ''
-for index in sorted(crate_stacks.keys()):
-    result += crate_stacks[index].pop()
-
-print(result)
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import random
+from string import ascii_lowercase
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A datastream of size characters where both markers are only found at the very end, so that solvers have to scan
+    the whole stream. All but the last 14 characters are drawn from three letters, which can never form a marker.
+    """
+    rng = random.Random(seed)
+    letters = rng.sample(ascii_lowercase, 17)
+    filler = letters[:3]
+    marker = letters[3:]
+    body = ''.join(rng.choice(filler) for _ in range(max(0, size - len(marker))))
+    return body + ''.join(marker) + '\n'
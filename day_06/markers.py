@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, Sequence
+
+
+def find_markers(signal_chunks: Iterable[str], marker_lengths: Sequence[int]) -> Dict[int, int]:
+    """
+    For each marker length, the number of characters read up to the end of the first run of that many distinct
+    characters. The signal ends at the first newline, and is read a chunk at a time in a single pass that stops once
+    every marker is found.
+
+    The last index each character was seen at gives the start of the longest run of distinct characters ending at each
+    position, which is the same whatever the marker length, so memory depends only on the size of the alphabet.
+    Marker lengths that never occur are missing from the result.
+    """
+    remaining = sorted(set(marker_lengths), reverse=True)
+    markers = {}
+    if not remaining:
+        return markers
+    last_seen = {}
+    seen_at = last_seen.get
+    run_start = 0
+    # The run must reach this index past its start to be the shortest marker still to be found
+    needed = remaining[-1] - 1
+    offset = 0
+    for chunk in signal_chunks:
+        end = chunk.find('\n')
+        if end >= 0:
+            chunk = chunk[:end]
+        for index, char in enumerate(chunk, offset):
+            previous = seen_at(char, -1)
+            if previous >= run_start:
+                run_start = previous + 1
+            last_seen[char] = index
+            if index - run_start < needed:
+                continue
+            # A run long enough for one marker may be long enough for longer ones too
+            while remaining and index - run_start + 1 >= remaining[-1]:
+                markers[remaining.pop()] = index + 1
+            if not remaining:
+                return markers
+            needed = remaining[-1] - 1
+        offset += len(chunk)
+        if end >= 0:
+            break
+    return markers
@@ -1,13 +1,32 @@
-from collections import defaultdict
 import sys
+from typing import List, Sequence
+
+from aoc.reader import PuzzleInput, chunks
+from day_06.markers import find_markers
 
 MARKER_LENGTH = 4
 
-line = sys.stdin.readline().strip('\n')
-index = 0
-while True:
-    chars = line[index:(index + MARKER_LENGTH)]
-    if len(set(chars)) == MARKER_LENGTH:
-        print(index + MARKER_LENGTH)
-        break
-    index += 1
+
+def solve(puzzle_input: PuzzleInput) -> int:
+    markers = find_markers(chunks(puzzle_input), [MARKER_LENGTH])
+    if MARKER_LENGTH not in markers:
+        raise ValueError(f"No marker of {MARKER_LENGTH} distinct characters")
+    return markers[MARKER_LENGTH]
+
+
+def solve_batch(signals: Sequence[str]) -> List[int]:
+    """
+    The answer for each of many signals, found for all of them at once with numpy. Signals without a marker give -1.
+    """
+    # Imported here so that solve() works without numpy
+    from day_06.vectorised import find_markers_batch
+
+    return find_markers_batch(signals, [MARKER_LENGTH])[MARKER_LENGTH].tolist()
+
+
+def main():
+    print(solve(sys.stdin))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Marker search over many signals at once with numpy, which this module needs.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+# Each character in a window is one bit of a 64 bit mask
+MAX_ALPHABET = 64
+
+
+def encode_signals(signals: Sequence[str]) -> (np.ndarray, np.ndarray):
+    """
+    The signals as rows of a uint8 array padded with zeros to the longest signal, and the length of each.
+    """
+    encoded = [signal.rstrip('\n').encode() for signal in signals]
+    lengths = np.array([len(signal) for signal in encoded], dtype=np.int64)
+    batch = np.zeros((len(encoded), int(lengths.max(initial=0))), dtype=np.uint8)
+    for row, signal in zip(batch, encoded):
+        row[:len(signal)] = np.frombuffer(signal, dtype=np.uint8)
+    return batch, lengths
+
+
+def character_bits(batch: np.ndarray) -> np.ndarray:
+    """
+    Each character replaced by a mask with a single bit set, a different bit for each character in the batch.
+    """
+    codes = np.unique(batch)
+    if len(codes) > MAX_ALPHABET:
+        raise ValueError(f"Signals use {len(codes)} different characters, at most {MAX_ALPHABET} are supported")
+    bit_lookup = np.zeros(256, dtype=np.uint64)
+    bit_lookup[codes] = np.left_shift(np.uint64(1), np.arange(len(codes), dtype=np.uint64))
+    return bit_lookup[batch]
+
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks)
+    # numpy before 2.0 has no popcount, so count the bits of each byte from a table
+    byte_counts = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+    return byte_counts[masks.view(np.uint8)].reshape(*masks.shape, 8).sum(axis=-1)
+
+
+def find_markers_batch(signals: Sequence[str], marker_lengths: Sequence[int]) -> Dict[int, np.ndarray]:
+    """
+    For each marker length, an array giving the end of the first marker in each signal, counted in characters from the
+    start of the signal as solve() does, or -1 for signals without one.
+
+    Windows are built up one character longer at a time by ORing in the masks of the next character along, so the
+    whole batch is searched with one array operation per character of the longest marker. A window of length k holds
+    a marker exactly when k bits of its mask are set.
+    """
+    batch, lengths = encode_signals(signals)
+    bits = character_bits(batch)
+    positions = np.arange(batch.shape[1])
+    markers = {}
+    windows = np.zeros_like(bits)
+    for length in range(1, max(marker_lengths, default=0) + 1):
+        # windows[:, start] covers the characters from start up to start + length - 1
+        windows = windows[:, :bits.shape[1] - length + 1] | bits[:, length - 1:]
+        if length not in marker_lengths:
+            continue
+        found = (popcount(windows) == length) & (positions[:windows.shape[1]] + length <= lengths[:, np.newaxis])
+        if not found.size:
+            markers[length] = np.full(len(signals), -1)
+            continue
+        markers[length] = np.where(found.any(axis=1), found.argmax(axis=1) + length, -1)
+    return markers
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from heapq import heapify, heappop, heappush
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+ROOT = 0
+SMALL_DIRECTORY_SIZE = 100_000
+FILE_SYSTEM_SIZE = 70_000_000
+REQUIRED_UPDATE_FREE_SIZE = 30_000_000
+# Buckets of SortedBuckets are split in half once they hold twice this many values
+BUCKET_SIZE = 500
+
+
+def required_delete_size(used_space_size: int) -> int:
+    free_space_size = FILE_SYSTEM_SIZE - used_space_size
+    return REQUIRED_UPDATE_FREE_SIZE - free_space_size
+
+
+@dataclass
+class FileSystem:
+    """
+    A directory tree held in flat lists indexed by directory number, with the root directory as number 0. Directories
+    are numbered in the order they are first entered, so every directory comes after its parent. Only directories are
+    stored: the sizes of the files listed in each are added up as they are read, so memory depends on the number of
+    directories rather than the length of the log.
+    """
+    parents: List[int] = field(default_factory=lambda: [-1])
+    # The number of each directory, keyed by its parent's number and its name
+    subdirectories: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    # The total size of the files directly inside each directory, not counting subdirectories
+    file_sizes: List[int] = field(default_factory=lambda: [0])
+    current_directory: int = ROOT
+    _sizes: Optional[List[int]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_log(cls, log_lines: Iterable[str]) -> FileSystem:
+        file_system = cls()
+        file_system.read_lines(log_lines)
+        return file_system
+
+    def add_directory(self, parent: int, name: str) -> int:
+        directory = len(self.parents)
+        self.parents.append(parent)
+        self.file_sizes.append(0)
+        self.subdirectories[parent, name] = directory
+        return directory
+
+    def add_file_size(self, directory: int, size: int) -> None:
+        self.file_sizes[directory] += size
+
+    def enter(self, name: str) -> None:
+        if name == '/':
+            self.current_directory = ROOT
+        elif name == '..':
+            if self.current_directory == ROOT:
+                raise ValueError("Cannot leave the root directory")
+            self.current_directory = self.parents[self.current_directory]
+        else:
+            directory = self.subdirectories.get((self.current_directory, name))
+            if directory is None:
+                directory = self.add_directory(self.current_directory, name)
+            self.current_directory = directory
+
+    def read_line(self, line: str) -> None:
+        self._sizes = None
+        if line.startswith('$ cd '):
+            self.enter(line[5:])
+        elif line == '$ ls':
+            # Listing a directory again replaces what was listed before
+            self.add_file_size(self.current_directory, -self.file_sizes[self.current_directory])
+        elif not line.startswith('$ '):
+            size, _name = line.split(' ')
+            # Ignore directories, we will have to cd into them to learn anything about them
+            if size != 'dir':
+                self.add_file_size(self.current_directory, int(size))
+        else:
+            raise Exception(f"Unexpected input {line}")
+
+    def read_lines(self, log_lines: Iterable[str]) -> None:
+        """
+        Read lines as read_line() would, except that the files of each listing are added up first and passed to
+        add_file_size() once for the whole listing. log_lines can be a generator such as aoc.reader.stream_lines(), in
+        which case no more than one line is held at a time.
+        """
+        self._sizes = None
+        listed_size = 0
+        for line in log_lines:
+            if line.startswith('$ '):
+                if listed_size:
+                    self.add_file_size(self.current_directory, listed_size)
+                    listed_size = 0
+                self.read_line(line)
+            else:
+                size, _name = line.split(' ')
+                if size != 'dir':
+                    listed_size += int(size)
+        if listed_size:
+            self.add_file_size(self.current_directory, listed_size)
+
+    def sizes(self) -> List[int]:
+        """
+        The total size of every directory including its subdirectories, indexed by directory number. As children are
+        always numbered after their parents, one pass from the last directory to the first adds each directory's
+        finished total into its parent. The result is kept until the tree next changes.
+        """
+        if self._sizes is None:
+            sizes = list(self.file_sizes)
+            parents = self.parents
+            for directory in range(len(sizes) - 1, ROOT, -1):
+                sizes[parents[directory]] += sizes[directory]
+            self._sizes = sizes
+        return self._sizes
+
+
+@dataclass
+class SortedBuckets:
+    """
+    A sorted list of numbers that may repeat, held as a list of sorted buckets alongside the largest number in each.
+    Finding a number's bucket is a bisect over those largest numbers, and adding or removing it only shifts the rest of
+    its bucket, so neither costs time proportional to the length of the whole list as it does for one list.
+    """
+    buckets: List[List[int]] = field(default_factory=list)
+    maxima: List[int] = field(default_factory=list)
+    length: int = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[int]:
+        for bucket in self.buckets:
+            yield from bucket
+
+    def add(self, value: int) -> None:
+        self.length += 1
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxima.append(value)
+            return
+        # Numbers larger than everything go in the last bucket
+        index = min(bisect_left(self.maxima, value), len(self.buckets) - 1)
+        bucket = self.buckets[index]
+        insort(bucket, value)
+        self.maxima[index] = bucket[-1]
+        if len(bucket) > 2 * BUCKET_SIZE:
+            self.buckets[index:index + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self.maxima[index:index + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def remove(self, value: int) -> None:
+        # Only the first bucket whose largest number is at least value can hold it, even with repeats
+        index = bisect_left(self.maxima, value)
+        bucket = self.buckets[index] if index < len(self.buckets) else []
+        position = bisect_left(bucket, value)
+        if position == len(bucket) or bucket[position] != value:
+            raise ValueError(f"{value} is not in the list")
+        del bucket[position]
+        self.length -= 1
+        if bucket:
+            self.maxima[index] = bucket[-1]
+        else:
+            del self.buckets[index]
+            del self.maxima[index]
+
+    def smallest_at_least(self, value: int) -> Optional[int]:
+        index = bisect_left(self.maxima, value)
+        if index == len(self.buckets):
+            return None
+        bucket = self.buckets[index]
+        return bucket[bisect_left(bucket, value)]
+
+
+@dataclass
+class LiveFileSystem(FileSystem):
+    """
+    A FileSystem that keeps every directory's total size up to date as the log is read, so that a log can be read as
+    it is written and queried at any point. Changes to file sizes are held back until the next query, then passed up
+    through the directories' ancestors, updating a SortedBuckets of all the totals and the sum of the totals no larger
+    than small_limit on the way. A query therefore costs a bisect and a shift of at most one bucket for each directory
+    above a change since the last query, however many changes there were beneath it. Queried after every listing,
+    that is about the depth of the tree per listing, but reading a whole log before querying touches each directory
+    once.
+    """
+    small_limit: int = SMALL_DIRECTORY_SIZE
+    totals: List[int] = field(default_factory=lambda: [0])
+    sorted_totals: SortedBuckets = field(default_factory=lambda: SortedBuckets(buckets=[[0]], maxima=[0], length=1))
+    _small_total: int = field(default=0, init=False, repr=False)
+    # Changes to the totals of directories, and of everything above them, not yet passed up the tree
+    _pending: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    def add_directory(self, parent: int, name: str) -> int:
+        directory = super().add_directory(parent, name)
+        self.totals.append(0)
+        self.sorted_totals.add(0)
+        return directory
+
+    def add_file_size(self, directory: int, size: int) -> None:
+        super().add_file_size(directory, size)
+        if size:
+            self._pending[directory] = self._pending.get(directory, 0) + size
+
+    def update_totals(self) -> None:
+        """
+        Pass the pending changes up the tree. Children are numbered after their parents, so taking directories from the
+        highest number down means that a directory's change already includes the changes of all its subdirectories
+        when it is applied and passed on to its parent.
+        """
+        pending = self._pending
+        queue = [-directory for directory in pending]
+        heapify(queue)
+        while queue:
+            directory = -heappop(queue)
+            size = pending.pop(directory)
+            if not size:
+                continue
+            parent = self.parents[directory]
+            if parent != -1:
+                if parent not in pending:
+                    pending[parent] = 0
+                    heappush(queue, -parent)
+                pending[parent] += size
+
+            old_total = self.totals[directory]
+            new_total = old_total + size
+            self.totals[directory] = new_total
+            self.sorted_totals.remove(old_total)
+            self.sorted_totals.add(new_total)
+            if old_total <= self.small_limit:
+                self._small_total -= old_total
+            if new_total <= self.small_limit:
+                self._small_total += new_total
+
+    @property
+    def small_total(self) -> int:
+        """
+        The sum of the totals no larger than small_limit.
+        """
+        self.update_totals()
+        return self._small_total
+
+    def sizes(self) -> List[int]:
+        self.update_totals()
+        return self.totals
+
+    def smallest_at_least(self, size: int) -> Optional[int]:
+        """
+        The smallest directory total of at least size, or None if every directory is smaller.
+        """
+        self.update_totals()
+        return self.sorted_totals.smallest_at_least(size)
@@ -0,0 +1,52 @@
+"""
+Follow a terminal log as it is written, like tail -f, printing the answers to both parts whenever they change.
+
+    python -m day_07.follow session.log
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Iterator, List
+
+from day_07.filesystem import ROOT, LiveFileSystem, required_delete_size
+
+
+def follow(path: Path, interval: float) -> Iterator[List[str]]:
+    """
+    The complete lines added to the file since it was last read, checking again every interval seconds once there are
+    none.
+    """
+    with open(path) as file:
+        partial_line = ''
+        while True:
+            text = file.read()
+            if not text:
+                time.sleep(interval)
+                continue
+            *complete_lines, partial_line = (partial_line + text).split('\n')
+            if complete_lines:
+                yield complete_lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('log', type=Path, help='terminal log to follow')
+    parser.add_argument('--interval', type=float, default=0.5, help='seconds between checks for new lines')
+    args = parser.parse_args()
+
+    file_system = LiveFileSystem()
+    answers = None
+    for log_lines in follow(args.log, args.interval):
+        file_system.read_lines(line for line in log_lines if line)
+        new_answers = (
+            file_system.small_total,
+            file_system.smallest_at_least(required_delete_size(file_system.sizes()[ROOT])),
+        )
+        if new_answers != answers:
+            answers = new_answers
+            print(*answers, flush=True)
+
+
+if __name__ == '__main__':
+    main()
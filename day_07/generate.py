@@ -0,0 +1,35 @@
+import random
+
+
+def generate(size: int, seed: int = 0, max_files: int = 5) -> str:
+    """
+    A terminal session that explores a random tree of size directories, listing every directory exactly once.
+    """
+    rng = random.Random(seed)
+    children = [[] for _ in range(size)]
+    for directory in range(1, size):
+        # Favour recently created directories as parents, which gives deeper trees than a uniform choice
+        parent = rng.randint(max(0, directory - 50), directory - 1)
+        children[parent].append(directory)
+
+    lines = ['$ cd /']
+    actions = [('list', 0)]
+    while actions:
+        action, directory = actions.pop()
+        if action == 'leave':
+            lines.append('$ cd ..')
+            continue
+        if action == 'enter':
+            lines.append(f"$ cd d{directory}")
+
+        lines.append('$ ls')
+        for child in children[directory]:
+            lines.append(f"dir d{child}")
+        for file_number in range(rng.randint(0, max_files)):
+            lines.append(f"{rng.randint(1, 300_000)} f{file_number}.{rng.choice(['txt', 'dat', 'log'])}")
+
+        for child in reversed(children[directory]):
+            actions.append(('leave', child))
+            actions.append(('enter', child))
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,70 @@
+from typing import List, Sequence, Tuple
+
+from aoc.reader import PuzzleInput, lines
+
+Grid = List[List[int]]
+
+
+def read_grid(puzzle_input: PuzzleInput) -> Grid:
+    return [[int(char) for char in line] for line in lines(puzzle_input)]
+
+
+def sweep(heights: Sequence[int]) -> Tuple[List[int], List[bool]]:
+    """
+    For each tree in a line, how far it can see looking back towards the start of the line, and whether it can be seen
+    from the start. A stack holds the trees that could still block the view of later trees, tallest at the bottom.
+    Each tree pops the shorter trees above it, which it hides from everything after it, so the whole line takes
+    linear time.
+    """
+    distances = [0] * len(heights)
+    visible = [False] * len(heights)
+    stack = []
+    for index, height in enumerate(heights):
+        while stack and heights[stack[-1]] < height:
+            stack.pop()
+        if stack:
+            distances[index] = index - stack[-1]
+        else:
+            distances[index] = index
+            visible[index] = True
+        stack.append(index)
+    return distances, visible
+
+
+def sweep_both_ways(heights: Sequence[int]) -> Tuple[List[int], List[int], List[bool], List[bool]]:
+    """
+    sweep() towards the start of the line and towards the end, as the viewing distances in each direction followed by
+    the visibility from each end.
+    """
+    forward_distances, forward_visible = sweep(heights)
+    backward_distances, backward_visible = sweep(heights[::-1])
+    return forward_distances, backward_distances[::-1], forward_visible, backward_visible[::-1]
+
+
+def visible_count(grid: Grid) -> int:
+    row_visible = []
+    for row in grid:
+        _left, _right, from_left, from_right = sweep_both_ways(row)
+        row_visible.append([left or right for left, right in zip(from_left, from_right)])
+
+    count = 0
+    for column, visible_in_rows in zip(zip(*grid), zip(*row_visible)):
+        _up, _down, from_top, from_bottom = sweep_both_ways(column)
+        count += sum(map(any, zip(from_top, from_bottom, visible_in_rows)))
+    return count
+
+
+def max_scenic_score(grid: Grid) -> int:
+    row_scores = []
+    for row in grid:
+        left, right, _from_left, _from_right = sweep_both_ways(row)
+        row_scores.append([left_distance * right_distance for left_distance, right_distance in zip(left, right)])
+
+    max_score = 0
+    for column, scores_in_rows in zip(zip(*grid), zip(*row_scores)):
+        up, down, _from_top, _from_bottom = sweep_both_ways(column)
+        for up_distance, down_distance, row_score in zip(up, down, scores_in_rows):
+            score = up_distance * down_distance * row_score
+            if score > max_score:
+                max_score = score
+    return max_score
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A size by size forest of random tree heights.
+    """
+    rng = random.Random(seed)
+    return ''.join(''.join(rng.choices('0123456789', k=size)) + '\n' for _ in range(size))
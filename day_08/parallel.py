@@ -0,0 +1,106 @@
+"""
+Part b's scenic scores for grids too large for one core, computed with numpy on a pool of worker processes.
+
+The grid is copied once into shared memory, along with an array of scores that the workers fill in, so neither is
+ever pickled. Looking left and right needs whole rows, and looking up and down needs whole columns, so the work is
+done in two rounds. First each worker takes a band of rows and stores the product of the left and right viewing
+distances of its trees. Then each takes a band of columns, multiplies in the up and down distances and returns the
+highest score in its band.
+"""
+
+import concurrent.futures
+import os
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+MAX_HEIGHT = 9
+# Each worker is given several bands, so that a slow band doesn't leave the other workers idle at the end
+BANDS_PER_JOB = 4
+
+_heights: Optional[np.ndarray] = None
+_scores: Optional[np.ndarray] = None
+_shared_memory: List[shared_memory.SharedMemory] = []
+
+
+def distances_towards_start(heights: np.ndarray) -> np.ndarray:
+    """
+    How far each tree can see towards the start of its row. For each tree height in turn, the position of every tree
+    at least that tall is carried along the row with np.maximum.accumulate, giving the nearest tree that blocks the
+    view of trees of that height. The edge of the grid at position 0 blocks every view.
+    """
+    positions = np.arange(heights.shape[1], dtype=np.int32)
+    distances = np.zeros(heights.shape, dtype=np.int32)
+    blocker = np.zeros(heights.shape, dtype=np.int32)
+    for height in range(MAX_HEIGHT + 1):
+        trees = heights == height
+        if not trees.any():
+            continue
+        blockers = np.where(heights >= height, positions, 0)
+        np.maximum.accumulate(blockers[:, :-1], axis=1, out=blocker[:, 1:])
+        np.copyto(distances, positions - blocker, where=trees)
+    return distances
+
+
+def distance_product(heights: np.ndarray) -> np.ndarray:
+    """
+    The product of the viewing distances towards the start and the end of each row.
+    """
+    product = distances_towards_start(heights).astype(np.int64)
+    product *= distances_towards_start(heights[:, ::-1])[:, ::-1]
+    return product
+
+
+def _attach(heights_name: str, scores_name: str, shape: Tuple[int, int]):
+    global _heights, _scores
+    heights_memory = shared_memory.SharedMemory(name=heights_name)
+    scores_memory = shared_memory.SharedMemory(name=scores_name)
+    # Keep the shared memory open for as long as the arrays that use it
+    _shared_memory[:] = [heights_memory, scores_memory]
+    _heights = np.ndarray(shape, dtype=np.uint8, buffer=heights_memory.buf)
+    _scores = np.ndarray(shape, dtype=np.int64, buffer=scores_memory.buf)
+
+
+def _score_rows(start: int, stop: int) -> None:
+    _scores[start:stop] = distance_product(_heights[start:stop])
+
+
+def _score_columns(start: int, stop: int) -> int:
+    columns = np.ascontiguousarray(_heights[:, start:stop].T)
+    scores = _scores[:, start:stop].T * distance_product(columns)
+    return int(scores.max(initial=0))
+
+
+def bands(length: int, count: int) -> List[Tuple[int, int]]:
+    edges = np.linspace(0, length, min(count, length) + 1, dtype=np.int64)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+
+def max_scenic_score(heights: np.ndarray, jobs: Optional[int] = None) -> int:
+    """
+    The highest scenic score, computed across jobs worker processes, or as many as there are CPUs. With one job the
+    whole grid is scored in this process instead.
+    """
+    if not heights.size:
+        return 0
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        return int((distance_product(heights) * distance_product(np.ascontiguousarray(heights.T)).T).max())
+
+    rows, columns = heights.shape
+    heights_memory = shared_memory.SharedMemory(create=True, size=heights.nbytes)
+    scores_memory = shared_memory.SharedMemory(create=True, size=heights.size * np.dtype(np.int64).itemsize)
+    try:
+        np.ndarray(heights.shape, dtype=np.uint8, buffer=heights_memory.buf)[:] = heights
+        initargs = (heights_memory.name, scores_memory.name, heights.shape)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_attach,
+                initargs=initargs) as executor:
+            list(executor.map(_score_rows, *zip(*bands(rows, jobs * BANDS_PER_JOB))))
+            return max(executor.map(_score_columns, *zip(*bands(columns, jobs * BANDS_PER_JOB))))
+    finally:
+        for memory in [heights_memory, scores_memory]:
+            memory.close()
+            memory.unlink()
@@ -1,30 +1,24 @@
 import sys
 
+from aoc.reader import PuzzleInput
+from day_08.forest import visible_count, read_grid
 
-def visible(tree_height, neighbour_heights):
-    return not any([neighbour_height >= tree_height for neighbour_height in neighbour_heights])
 
+def solve(puzzle_input: PuzzleInput, vectorised: bool = False) -> int:
+    """
+    With vectorised set the forest is read into a numpy array and every tree is checked at once.
+    """
+    if vectorised:
+        # Imported here so that solve() works without numpy
+        from day_08 import vectorised as forest_array
 
-grid = []
+        return forest_array.visible_count(forest_array.read_array(puzzle_input))
+    return visible_count(read_grid(puzzle_input))
 
-line = [int(char) for char in sys.stdin.readline().strip('\n')]
-while line:
-    grid.append(line)
-    line = [int(char) for char in sys.stdin.readline().strip('\n')]
 
-visible_count = 0
-for y in range(len(grid)):
-    for x in range(len(grid[0])):
-        tree_height = grid[y][x]
-        left_slice = grid[y][:x]
-        right_slice = grid[y][x + 1:]
-        top_slice = [row[x] for row in grid[:y]]
-        bottom_slice = [row[x] for row in grid[y + 1:]]
+def main():
+    print(solve(sys.stdin))
 
-        if visible(tree_height, left_slice) or \
-                visible(tree_height, right_slice) or \
-                visible(tree_height, top_slice) or \
-                visible(tree_height, bottom_slice):
-            visible_count += 1
 
-print(visible_count)
+if __name__ == '__main__':
+    main()
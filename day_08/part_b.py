@@ -1,38 +1,26 @@
 import sys
 
+from aoc.reader import PuzzleInput
+from day_08.forest import max_scenic_score, read_grid
 
-def distance_unblocked(tree_height, neighbour_heights):
-    for distance, neighbour_height in enumerate(neighbour_heights):
-        if neighbour_height >= tree_height:
-            return distance + 1
-    return len(neighbour_heights)
-
-
-grid = []
-
-line = [int(char) for char in sys.stdin.readline().strip('\n')]
-while line:
-    grid.append(line)
-    line = [int(char) for char in sys.stdin.readline().strip('\n')]
-
-max_scenic_score = 0
-for y in range(len(grid)):
-    for x in range(len(grid[0])):
-        tree_height = grid[y][x]
-        left_slice = grid[y][:x]
-        left_slice.reverse()
-        right_slice = grid[y][x + 1:]
-        top_slice = [row[x] for row in grid[:y]]
-        top_slice.reverse()
-        bottom_slice = [row[x] for row in grid[y + 1:]]
-
-        left_distance_unblocked = distance_unblocked(tree_height, left_slice)
-        right_distance_unblocked = distance_unblocked(tree_height, right_slice)
-        top_distance_unblocked = distance_unblocked(tree_height, top_slice)
-        bottom_distance_unblocked = distance_unblocked(tree_height, bottom_slice)
-
-        scenic_score = left_distance_unblocked * right_distance_unblocked * top_distance_unblocked * bottom_distance_unblocked
-        if scenic_score > max_scenic_score:
-            max_scenic_score = scenic_score
-
-print(max_scenic_score)
+
+def solve(puzzle_input: PuzzleInput, vectorised: bool = False, jobs: int = 1) -> int:
+    """
+    With vectorised set the viewing distances are computed with numpy, split across jobs worker processes. jobs=0 uses
+    one process per CPU.
+    """
+    if vectorised:
+        # Imported here so that solve() works without numpy
+        from day_08 import parallel
+        from day_08.vectorised import read_array
+
+        return parallel.max_scenic_score(read_array(puzzle_input), jobs)
+    return max_scenic_score(read_grid(puzzle_input))
+
+
+def main():
+    print(solve(sys.stdin))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+The forest as a numpy array, which this module needs, for solving without any Python code per tree.
+"""
+
+import numpy as np
+
+from aoc.reader import PuzzleInput, read_text
+
+
+def read_array(puzzle_input: PuzzleInput) -> np.ndarray:
+    """
+    The tree heights as a uint8 array, made by viewing the bytes of the input as rows that each end in a newline.
+    """
+    data = np.frombuffer((read_text(puzzle_input).rstrip('\n') + '\n').encode(), dtype=np.uint8)
+    width = int(np.argmax(data == ord('\n')))
+    if len(data) % (width + 1):
+        raise ValueError("Rows of the forest differ in length")
+    rows = data.reshape(-1, width + 1)
+    # Rows of other lengths can still add up to a multiple of the first, so every row must end where the first does
+    if not (rows[:, width] == ord('\n')).all():
+        raise ValueError("Rows of the forest differ in length")
+    return rows[:, :width] - ord('0')
+
+
+def visible_from_start(heights: np.ndarray) -> np.ndarray:
+    """
+    Whether each tree can be seen from the start of its row, being taller than the running maximum of the trees before
+    it. Trees on the edge have nothing before them, which counts as height -1.
+    """
+    before = np.full(heights.shape, -1, dtype=np.int8)
+    before[:, 1:] = np.maximum.accumulate(heights[:, :-1], axis=1)
+    return heights > before
+
+
+def visible_count(heights: np.ndarray) -> int:
+    if not heights.size:
+        return 0
+    visible = visible_from_start(heights)
+    visible |= visible_from_start(heights[:, ::-1])[:, ::-1]
+    visible |= visible_from_start(heights.T).T
+    visible |= visible_from_start(heights.T[:, ::-1])[:, ::-1].T
+    return int(visible.sum())
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size: int, seed: int = 0, max_distance: int = 20) -> str:
+    """
+    size random head motions, each between 1 and max_distance steps.
+    """
+    rng = random.Random(seed)
+    return ''.join(f"{rng.choice('LRUD')} {rng.randint(1, max_distance)}\n" for _ in range(size))
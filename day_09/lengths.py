@@ -0,0 +1,29 @@
+"""
+Count the positions visited by the tails of ropes of several lengths, simulating the moves only once.
+
+    python -m day_09.lengths 2 10 < day_09/input.txt
+"""
+
+import argparse
+import sys
+
+from day_09.rope import read_moves, tail_positions_by_length
+from day_09.visited import STORES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('lengths', type=int, nargs='+', help='numbers of knots in the ropes')
+    parser.add_argument('--store', choices=STORES, default='bitmap', help='how visited positions are stored')
+    args = parser.parse_args()
+
+    if min(args.lengths) < 1:
+        parser.error("ropes need at least one knot")
+
+    counts = tail_positions_by_length(read_moves(sys.stdin), args.lengths, args.store)
+    for length in args.lengths:
+        print(length, counts[length])
+
+
+if __name__ == '__main__':
+    main()
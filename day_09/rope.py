@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from aoc.reader import PuzzleInput, lines
+from day_09.visited import STORES, ChunkedBitmap, PositionSet
+
+DIRECTIONS = {
+    'L': (-1, 0),
+    'R': (1, 0),
+    'D': (0, -1),
+    'U': (0, 1),
+}
+
+Move = Tuple[int, int, int]
+
+
+def read_moves(puzzle_input: PuzzleInput) -> List[Move]:
+    """
+    Each motion of the head as its step in x, its step in y and the number of steps.
+    """
+    moves = []
+    for line in lines(puzzle_input):
+        direction, distance = line.split(' ')
+        step_x, step_y = DIRECTIONS[direction]
+        moves.append((step_x, step_y, int(distance)))
+    return moves
+
+
+@dataclass
+class Rope:
+    """
+    A rope of length knots, all starting at the origin, with the head at index 0. The positions visited by the tail
+    are collected in visited, which can be any of the stores in day_09.visited.
+    """
+    length: int
+    visited: Union[PositionSet, ChunkedBitmap] = field(default_factory=ChunkedBitmap)
+    xs: List[int] = field(init=False)
+    ys: List[int] = field(init=False)
+
+    def __post_init__(self):
+        if self.length < 1:
+            raise ValueError(f"A rope needs at least one knot, not {self.length}")
+        self.xs = [0] * self.length
+        self.ys = [0] * self.length
+        self.visited.add(0, 0)
+
+    def move(self, step_x: int, step_y: int, distance: int) -> None:
+        """
+        Move the head distance steps. After each step the knots behind it catch up in turn, but only as far along the
+        rope as knots keep moving: a knot that stays put leaves every knot behind it where it was too. The tail's
+        position is only recorded when the tail moves.
+        """
+        xs, ys, visited = self.xs, self.ys, self.visited
+        tail = self.length - 1
+        for _ in range(distance):
+            xs[0] += step_x
+            ys[0] += step_y
+            knot = 1
+            while knot <= tail:
+                offset_x = xs[knot - 1] - xs[knot]
+                offset_y = ys[knot - 1] - ys[knot]
+                if -1 <= offset_x <= 1 and -1 <= offset_y <= 1:
+                    break
+                xs[knot] += (offset_x > 0) - (offset_x < 0)
+                ys[knot] += (offset_y > 0) - (offset_y < 0)
+                knot += 1
+            else:
+                visited.add(xs[tail], ys[tail])
+
+
+@dataclass
+class EveryKnotRope(Rope):
+    """
+    A Rope that records the positions visited by every knot rather than just the tail, each in its own store made by
+    calling store. A knot only follows the knots in front of it, so knot k moves just as the tail of a rope of k + 1
+    knots would, and one rope of the longest length answers every shorter length too.
+    """
+    store: Callable[[], Union[PositionSet, ChunkedBitmap]] = ChunkedBitmap
+    visited_by_knot: List[Union[PositionSet, ChunkedBitmap]] = field(init=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.visited_by_knot = [self.store() for _ in range(self.length - 1)] + [self.visited]
+        for visited in self.visited_by_knot[:-1]:
+            visited.add(0, 0)
+
+    def move(self, step_x: int, step_y: int, distance: int) -> None:
+        xs, ys, visited_by_knot = self.xs, self.ys, self.visited_by_knot
+        length = self.length
+        for _ in range(distance):
+            xs[0] += step_x
+            ys[0] += step_y
+            visited_by_knot[0].add(xs[0], ys[0])
+            for knot in range(1, length):
+                offset_x = xs[knot - 1] - xs[knot]
+                offset_y = ys[knot - 1] - ys[knot]
+                if -1 <= offset_x <= 1 and -1 <= offset_y <= 1:
+                    break
+                xs[knot] += (offset_x > 0) - (offset_x < 0)
+                ys[knot] += (offset_y > 0) - (offset_y < 0)
+                visited_by_knot[knot].add(xs[knot], ys[knot])
+
+
+def tail_positions(moves: List[Move], rope_length: int, store: str = 'bitmap') -> int:
+    """
+    The number of distinct positions the tail of a rope of rope_length knots visits, recorded in the named store from
+    day_09.visited.STORES.
+    """
+    rope = Rope(rope_length, STORES[store]())
+    for step_x, step_y, distance in moves:
+        rope.move(step_x, step_y, distance)
+    return len(rope.visited)
+
+
+def tail_positions_by_length(moves: List[Move], rope_lengths: Sequence[int], store: str = 'bitmap') -> Dict[int, int]:
+    """
+    tail_positions() for each of several rope lengths, from a single pass with a rope of the longest length.
+    """
+    rope = EveryKnotRope(max(rope_lengths), STORES[store](), STORES[store])
+    for step_x, step_y, distance in moves:
+        rope.move(step_x, step_y, distance)
+    return {length: len(rope.visited_by_knot[length - 1]) for length in rope_lengths}
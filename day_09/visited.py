@@ -0,0 +1,65 @@
+"""
+Stores for the positions a rope's tail has visited. Each has add(x, y) and len(), so the rope can use any of them.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
+
+# Bitmap chunks are CHUNK_SIZE cells square, which must be a power of two
+CHUNK_BITS = 6
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+
+@dataclass
+class PositionSet:
+    """
+    Visited positions as a set of tuples. Simple and fast, but each position costs around 100 bytes.
+    """
+    positions: Set[Tuple[int, int]] = field(default_factory=set)
+
+    def add(self, x: int, y: int) -> None:
+        self.positions.add((x, y))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+@dataclass
+class ChunkedBitmap:
+    """
+    Visited positions as one bit per cell, in square chunks of the plane that are only allocated once a position in
+    them is visited, so the bitmap grows in whichever direction the rope wanders. A chunk of 4096 cells takes 512
+    bytes, so a rope that covers its ground densely needs a few bits per cell rather than a hundred bytes.
+    """
+    chunks: Dict[Tuple[int, int], bytearray] = field(default_factory=dict)
+    # Consecutive positions are nearly always in the same chunk, so the last one used is kept to hand
+    _last_key: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False)
+    _last_chunk: Optional[bytearray] = field(default=None, init=False, repr=False)
+
+    def add(self, x: int, y: int) -> None:
+        key = (x >> CHUNK_BITS, y >> CHUNK_BITS)
+        if key == self._last_key:
+            chunk = self._last_chunk
+        else:
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = self.chunks[key] = bytearray(CHUNK_SIZE * CHUNK_SIZE // 8)
+            self._last_key, self._last_chunk = key, chunk
+        cell = ((y & CHUNK_MASK) << CHUNK_BITS) | (x & CHUNK_MASK)
+        chunk[cell >> 3] |= 1 << (cell & 7)
+
+    def __contains__(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        chunk = self.chunks.get((x >> CHUNK_BITS, y >> CHUNK_BITS))
+        cell = ((y & CHUNK_MASK) << CHUNK_BITS) | (x & CHUNK_MASK)
+        return chunk is not None and bool(chunk[cell >> 3] & (1 << (cell & 7)))
+
+    def __len__(self) -> int:
+        return sum(int.from_bytes(chunk, 'little').bit_count() for chunk in self.chunks.values())
+
+
+STORES = {
+    'set': PositionSet,
+    'bitmap': ChunkedBitmap,
+}
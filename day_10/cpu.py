@@ -0,0 +1,225 @@
+"""
+The CPU compiled into numpy arrays, which this module needs, so that the register's value at every cycle comes from a
+prefix sum rather than from running the program an instruction at a time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+from aoc.reader import PuzzleInput, read_text
+
+# Cycles taken by each opcode, noop then addx
+CYCLES = np.array([1, 2], dtype=np.int32)
+INITIAL_REGISTER_VALUE = 1
+CRT_WIDTH = 40
+FIRST_SAMPLED_CYCLE = 20
+SAMPLE_INTERVAL = 40
+# Bytes read at once from the start of each line, enough to hold either opcode and the space after it
+PREFIX_BYTES = 8
+
+
+@dataclass
+class Program:
+    opcodes: np.ndarray
+    operands: np.ndarray
+
+
+def line_prefixes(encoded: bytes, starts: np.ndarray) -> np.ndarray:
+    """
+    The PREFIX_BYTES bytes from each start as one little endian integer, read through a view of the bytes in which
+    every position starts an overlapping word, so that each line takes a single lookup. The bytes must run on for
+    PREFIX_BYTES past every start.
+    """
+    words = np.ndarray((len(encoded) - PREFIX_BYTES + 1,), dtype='<u8', buffer=encoded, strides=(1,))
+    return words[starts]
+
+
+def prefix_matches(prefixes: np.ndarray, prefix: str) -> np.ndarray:
+    mask = np.uint64((1 << 8 * len(prefix)) - 1)
+    return (prefixes & mask) == np.uint64(int.from_bytes(prefix.encode(), 'little'))
+
+
+def compile_program(puzzle_input: PuzzleInput) -> Program:
+    """
+    Parse the program into an opcode and an operand per instruction, straight from the bytes of the input. Opcodes are
+    matched against the first bytes of every line at once, and the operands of addx are read backwards from the end of
+    their lines a digit at a time. Lines that are neither noop nor addx with a whole number raise a ValueError, as the
+    interpreter loop does.
+    """
+    text = read_text(puzzle_input).rstrip('\n')
+    # Padded so that reading the start of a line never runs past the end, whatever the length of the last line
+    encoded = (text + '\n' if text else '').encode() + bytes(PREFIX_BYTES)
+    data = np.frombuffer(encoded, dtype=np.uint8)
+    ends = np.flatnonzero(data == ord('\n')).astype(np.int32)
+    starts = np.zeros_like(ends)
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts
+    prefixes = line_prefixes(encoded, starts)
+    is_noop = (lengths == len('noop')) & prefix_matches(prefixes, 'noop')
+    is_addx = (lengths > len('addx ')) & prefix_matches(prefixes, 'addx ')
+
+    operand_ends = ends[is_addx]
+    values = np.zeros(len(operand_ends), dtype=np.int64)
+    digit_counts = np.zeros(len(operand_ends), dtype=np.int32)
+    place_value = 1
+    # Operands still being read, which is those whose digits so far reach back this far
+    reading = np.ones(len(operand_ends), dtype=bool)
+    offset = 1
+    while reading.any():
+        characters = data[operand_ends - offset]
+        reading &= (characters >= ord('0')) & (characters <= ord('9'))
+        values += np.where(reading, characters.astype(np.int64) - ord('0'), 0) * place_value
+        digit_counts += reading
+        place_value *= 10
+        offset += 1
+    # The digits must reach back to just after the space, or to just after a minus sign straight after it
+    before_digits = operand_ends - digit_counts - 1
+    negative = data[before_digits] == ord('-')
+    operand_starts = starts[is_addx] + len('addx ')
+    is_addx[is_addx] = (digit_counts > 0) & (before_digits + 1 - negative == operand_starts)
+
+    unexpected = np.flatnonzero(~is_noop & ~is_addx)
+    if len(unexpected):
+        line = data[starts[unexpected[0]]:ends[unexpected[0]]].tobytes().decode()
+        raise ValueError(f"Unexpected line {line!r}")
+
+    operands = np.zeros(len(ends), dtype=np.int64)
+    operands[is_addx] = np.where(negative, -values, values)
+    return Program(opcodes=is_addx.astype(np.int8), operands=operands)
+
+
+@dataclass
+class Timeline:
+    """
+    Answers questions about a run of the program from its register timeline, which is worked out once. The registers
+    hold the value during each cycle, with cycle 1 at index 0, and instruction_ends the last cycle of each instruction.
+    Cycles are numbered from 1, as in the puzzle. Signal strengths are kept as a prefix sum, so the sum over any range
+    of cycles is a subtraction. That sum, and the cycles holding each register value that breakpoints on a value
+    search, are only worked out the first time they are needed.
+    """
+    registers: np.ndarray
+    instruction_ends: np.ndarray
+    _strength_totals: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _cycles_by_value: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_program(cls, program: Program) -> Timeline:
+        """
+        Each instruction's change to the register lands after its final cycle, so the timeline is the initial value
+        plus a prefix sum of those changes. It runs one past the end of the program, to hold the value the program
+        finishes with.
+        """
+        instruction_ends = np.cumsum(CYCLES[program.opcodes], dtype=np.int64)
+        changes = np.zeros(int(instruction_ends[-1]) + 1 if len(instruction_ends) else 1, dtype=np.int64)
+        changes[instruction_ends] = program.operands
+        return cls(registers=INITIAL_REGISTER_VALUE + np.cumsum(changes), instruction_ends=instruction_ends)
+
+    @classmethod
+    def from_input(cls, puzzle_input: PuzzleInput) -> Timeline:
+        return cls.from_program(compile_program(puzzle_input))
+
+    @property
+    def cycles(self) -> int:
+        return len(self.registers) - 1
+
+    @property
+    def final_register(self) -> int:
+        return int(self.registers[-1])
+
+    def check_cycles(self, cycles: np.ndarray, after_end: bool = False) -> np.ndarray:
+        """
+        The cycles as an array, checking that the program runs in each of them. With after_end set the cycle just after
+        the program ends, when the register holds its final value, is allowed too.
+        """
+        cycles = np.asarray(cycles, dtype=np.int64)
+        last = self.cycles + 1 if after_end else self.cycles
+        if cycles.size and (cycles.min() < 1 or cycles.max() > last):
+            raise ValueError(f"Cycles must be from 1 to {last}")
+        return cycles
+
+    def register_at(self, cycle: int) -> int:
+        """
+        The register's value during the cycle.
+        """
+        return int(self.registers[self.check_cycles(cycle) - 1])
+
+    def registers_at(self, cycles) -> np.ndarray:
+        return self.registers[self.check_cycles(cycles) - 1]
+
+    def strengths(self, cycles, after_end: bool = False) -> np.ndarray:
+        cycles = self.check_cycles(cycles, after_end)
+        return cycles * self.registers[cycles - 1]
+
+    @property
+    def strength_totals(self) -> np.ndarray:
+        """
+        The sum of the signal strengths of every cycle up to each one, with 0 before the first.
+        """
+        if self._strength_totals is None:
+            cycles = np.arange(1, self.cycles + 1)
+            self._strength_totals = np.concatenate(([0], np.cumsum(cycles * self.registers[:-1])))
+        return self._strength_totals
+
+    def strength_sum(self, first: int = 1, last: Optional[int] = None) -> int:
+        """
+        The sum of the signal strengths of every cycle from first to last inclusive, defaulting to the whole run.
+        """
+        last = self.cycles if last is None else last
+        if first > last:
+            return 0
+        self.check_cycles([first, last])
+        return int(self.strength_totals[last] - self.strength_totals[first - 1])
+
+    def sampled_strength_sum(
+            self,
+            first: int = FIRST_SAMPLED_CYCLE,
+            interval: int = SAMPLE_INTERVAL,
+            last: Optional[int] = None) -> int:
+        """
+        The sum of the signal strengths of every interval-th cycle from first up to last, as the puzzle samples them.
+        That includes the cycle just after the program ends, which the sampling reaches before the CPU stops.
+        """
+        last = self.cycles + 1 if last is None else min(last, self.cycles + 1)
+        return int(self.strengths(np.arange(first, last + 1, interval), after_end=True).sum())
+
+    def instruction_at(self, cycle: int) -> int:
+        """
+        The index of the instruction being run during the cycle, counting from 0.
+        """
+        return int(np.searchsorted(self.instruction_ends, self.check_cycles(cycle)))
+
+    def instruction_cycle(self, instruction: int) -> int:
+        """
+        The cycle in which the instruction starts, so as to break before it runs.
+        """
+        if not 0 <= instruction < len(self.instruction_ends):
+            raise ValueError(f"Instructions must be from 0 to {len(self.instruction_ends) - 1}")
+        return int(self.instruction_ends[instruction - 1]) + 1 if instruction else 1
+
+    def next_cycle_with(self, value: int, after: int = 0) -> Optional[int]:
+        """
+        The first cycle after the given one during which the register holds the value, or None if it never does
+        again, for breaking on the register's value.
+        """
+        if self._cycles_by_value is None:
+            # Cycles grouped by value, and by cycle within each value
+            order = np.argsort(self.registers[:-1], kind='stable')
+            self._cycles_by_value = (self.registers[order], order + 1)
+        values, cycles = self._cycles_by_value
+        start, end = np.searchsorted(values, [value, value + 1])
+        index = start + np.searchsorted(cycles[start:end], after, side='right')
+        return int(cycles[index]) if index < end else None
+
+    def render(self, width: int = CRT_WIDTH) -> str:
+        """
+        The CRT image drawn while the program runs, width pixels to a row, lit where the sprite covers the pixel drawn
+        in that cycle.
+        """
+        drawn = self.registers[:-1]
+        positions = np.arange(len(drawn)) % width
+        pixels = np.where(np.abs(drawn - positions) <= 1, ord('#'), ord('.')).astype(np.uint8).tobytes().decode()
+        return '\n'.join(pixels[start:start + width] for start in range(0, len(pixels), width))
@@ -0,0 +1,21 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A program of size instructions, with the register kept roughly within the width of the CRT.
+    """
+    rng = random.Random(seed)
+    register_value = 1
+    lines = []
+    for _ in range(size):
+        if rng.random() < 0.3:
+            lines.append('noop')
+            continue
+
+        change = rng.randint(-10, 10)
+        if not -5 <= register_value + change <= 45:
+            change = -change
+        register_value += change
+        lines.append(f"addx {change}")
+    return '\n'.join(lines) + '\n'
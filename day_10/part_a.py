@@ -2,21 +2,28 @@
 
 import sys
 
+from aoc.reader import PuzzleInput, lines
+
 
 def sampled_cycle(cycle_number):
     return ((cycle_number + 20) // 40) * 40 - 20
 
 
-def main():
+def solve(puzzle_input: PuzzleInput, vectorised: bool = False) -> int:
+    """
+    With vectorised set the program is compiled with numpy and the register's value at every cycle found at once.
+    """
+    if vectorised:
+        # Imported here so that solve() works without numpy
+        from day_10 import cpu
+
+        return cpu.Timeline.from_input(puzzle_input).sampled_strength_sum()
+
     cycle_number = 1
     register_value = 1
     signal_strength_sum = 0
 
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
+    for line in lines(puzzle_input):
         if line == 'noop':
             cost = 1
             change = 0
@@ -41,7 +48,11 @@ def main():
         register_value = new_register_value
         cycle_number = new_cycle_number
 
-    print(signal_strength_sum)
+    return signal_strength_sum
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
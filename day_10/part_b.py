@@ -2,21 +2,28 @@
 
 import sys
 
+from aoc.reader import PuzzleInput, lines
+
 
 def sampled_cycle(cycle_number):
     return ((cycle_number + 20) // 40) * 40 - 20
 
 
-def main():
+def solve(puzzle_input: PuzzleInput, vectorised: bool = False) -> str:
+    """
+    With vectorised set the program is compiled with numpy and the register's value at every cycle found at once.
+    """
+    if vectorised:
+        # Imported here so that solve() works without numpy
+        from day_10 import cpu
+
+        return cpu.Timeline.from_input(puzzle_input).render()
+
     cycle_number = 1
     register_value = 1
-    signal_strength_sum = 0
-
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
+    rows = []
 
+    for line in lines(puzzle_input):
         if line == 'noop':
             cost = 1
             change = 0
@@ -28,16 +35,21 @@ def main():
         for _ in range(cost):
             x_position = (cycle_number - 1) % 40
             if x_position == 0:
-                print()
+                rows.append('')
             if (register_value - 1) <= x_position <= (register_value + 1):
-                print('#', end='')
+                rows[-1] += '#'
             else:
-                print('.', end='')
+                rows[-1] += '.'
             cycle_number += 1
 
         register_value += change
 
-    print()
+    return '\n'.join(rows)
+
+
+def main():
+    print(solve(sys.stdin))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,36 @@
+import random
+
+DIVISORS = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def generate(size: int, seed: int = 0, monkey_count: int = 8) -> str:
+    """
+    monkey_count monkeys holding size items between them, with every monkey starting with at least one item. Each
+    monkey tests divisibility by a different prime and exactly one monkey squares the worry level, as in the real
+    puzzles.
+    """
+    rng = random.Random(seed)
+    divisors = rng.sample(DIVISORS, monkey_count)
+    squaring_monkey = rng.randrange(monkey_count)
+    item_owners = list(range(monkey_count)) + [rng.randrange(monkey_count) for _ in range(size - monkey_count)]
+
+    monkeys = []
+    for number in range(monkey_count):
+        items = [str(rng.randint(50, 99)) for owner in item_owners if owner == number]
+        if number == squaring_monkey:
+            operation = 'old * old'
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        monkey_if_true, monkey_if_false = rng.sample([other for other in range(monkey_count) if other != number], 2)
+        monkeys.append('\n'.join([
+            f"Monkey {number}:",
+            f"  Starting items: {', '.join(items)}",
+            f"  Operation: new = {operation}",
+            f"  Test: divisible by {divisors[number]}",
+            f"    If true: throw to monkey {monkey_if_true}",
+            f"    If false: throw to monkey {monkey_if_false}",
+        ]))
+
+    return '\n\n'.join(monkeys) + '\n'
@@ -0,0 +1,107 @@
+"""
+Items never affect one another, so the number of times each monkey inspects an item can be found by following that
+item on its own. Under the combined modulo an item's state at the start of a round, the monkey holding it and its worry
+level, can only take finitely many values, so it eventually repeats. From then on the item goes round the same cycle of
+rounds, and its inspections over any number of rounds follow from one pass around the cycle.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from day_11.monkeys import Monkey, Operation, sorted_monkeys
+
+# A monkey's operation, test divisor, and the positions in the order of play of the monkeys it throws to if the test
+# passes and if it fails
+Rule = Tuple[Operation, int, int, int]
+# The position in the order of play of the monkey holding an item, with the item's worry level
+State = Tuple[int, int]
+
+
+def monkey_rules(monkeys: Dict[int, Monkey]) -> List[Rule]:
+    in_order = sorted_monkeys(monkeys)
+    positions = {monkey.number: position for position, monkey in enumerate(in_order)}
+    return [
+        (
+            monkey.operation,
+            monkey.test_divisible_by,
+            positions[monkey.monkey_if_true],
+            positions[monkey.monkey_if_false],
+        )
+        for monkey in in_order
+    ]
+
+
+def item_states(monkeys: Dict[int, Monkey], combined_modulo: int) -> Counter:
+    """
+    How many items start in each state. Items in the same state go the same way, so each state need only be followed
+    once.
+    """
+    return Counter(
+        (position, item % combined_modulo)
+        for position, monkey in enumerate(sorted_monkeys(monkeys))
+        for item in monkey.items
+    )
+
+
+def item_inspections(rules: List[Rule], state: State, rounds: int, combined_modulo: int) -> List[int]:
+    """
+    How many times each monkey, in order of play, inspects an item starting in the state over the rounds. Within a
+    round an item thrown to a monkey later in the order of play is inspected again in the same round, and one thrown
+    to an earlier monkey waits for the next. Every state seen is remembered, so memory grows with the length of the
+    cycle, or with the rounds if they end first.
+    """
+    position, worry = state
+    # When each state was first seen at the start of a round
+    seen: Dict[State, int] = {}
+    # The monkeys that inspected the item, in turn, and where in that list each round starts
+    inspections: List[int] = []
+    round_starts: List[int] = []
+    while len(round_starts) < rounds and state not in seen:
+        seen[state] = len(round_starts)
+        round_starts.append(len(inspections))
+        while True:
+            inspections.append(position)
+            operation, test_divisible_by, position_if_true, position_if_false = rules[position]
+            worry = operation(worry) % combined_modulo
+            target = position_if_true if worry % test_divisible_by == 0 else position_if_false
+            later = target > position
+            position = target
+            if not later:
+                break
+        state = (position, worry)
+
+    counts = Counter(inspections)
+    played = len(round_starts)
+    if played < rounds:
+        cycle_start = seen[state]
+        cycles, remainder = divmod(rounds - played, played - cycle_start)
+        cycle = Counter(inspections[round_starts[cycle_start]:])
+        partial_cycle = Counter(inspections[round_starts[cycle_start]:round_starts[cycle_start + remainder]])
+        for monkey in range(len(rules)):
+            counts[monkey] += cycles * cycle[monkey] + partial_cycle[monkey]
+    return [counts[monkey] for monkey in range(len(rules))]
+
+
+def weighted_inspections(
+        rules: List[Rule],
+        states: Iterable[Tuple[State, int]],
+        rounds: int,
+        combined_modulo: int) -> List[int]:
+    """
+    How many times each monkey, in order of play, inspects the items over the rounds, given each starting state with
+    its number of items.
+    """
+    totals = [0] * len(rules)
+    for state, item_count in states:
+        for monkey, count in enumerate(item_inspections(rules, state, rounds, combined_modulo)):
+            totals[monkey] += count * item_count
+    return totals
+
+
+def inspect_counts(monkeys: Dict[int, Monkey], rounds: int, combined_modulo: int) -> List[int]:
+    """
+    Each monkey's inspect count after the rounds, in order of their numbers, the same as play_rounds() gives with the
+    combined modulo.
+    """
+    states = item_states(monkeys, combined_modulo)
+    return weighted_inspections(monkey_rules(monkeys), states.items(), rounds, combined_modulo)
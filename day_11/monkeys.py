@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from aoc.reader import PuzzleInput, records
+
+OPERATORS = ['+', '*']
+# Monkeys get bored with an item after inspecting it, which divides its worry level by this, until part b
+RELIEF = 3
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    How a monkey changes an item's worry level: the old level plus or times the operand, where an operand of None
+    stands for the old level itself. Unlike a lambda, this can be sent to another process.
+    """
+    operator: str
+    operand: Optional[int] = None
+
+    def __call__(self, old: int) -> int:
+        operand = old if self.operand is None else self.operand
+        if self.operator == '*':
+            return old * operand
+        return old + operand
+
+    @classmethod
+    def parse(cls, expression: str) -> Operation:
+        """
+        Read the right hand side of the operation, such as old * 19.
+        """
+        left, operator, right = expression.split(' ')
+        if left != 'old' or operator not in OPERATORS:
+            raise ValueError(f"Unexpected operation {expression}")
+        return cls(operator=operator, operand=None if right == 'old' else int(right))
+
+
+@dataclass
+class Monkey:
+    number: int
+    items: List[int]
+    operation: Operation
+    test_divisible_by: int
+    monkey_if_true: int
+    monkey_if_false: int
+    inspect_count: int = field(default_factory=int)
+
+    def target(self, item: int) -> int:
+        if item % self.test_divisible_by == 0:
+            return self.monkey_if_true
+        return self.monkey_if_false
+
+    def throw_items(self, monkeys: Dict[int, Monkey], combined_modulo: Optional[int] = None) -> None:
+        """
+        Inspect and throw every item held. With a combined_modulo worry levels are kept below it, which leaves every
+        monkey's test unchanged, and without one they are divided by RELIEF.
+        """
+        items = self.items
+        self.items = []
+        self.inspect_count += len(items)
+        for item in items:
+            item = self.operation(item)
+            if combined_modulo is None:
+                item = item // RELIEF
+            else:
+                item = item % combined_modulo
+            monkeys[self.target(item)].receive_item(item)
+
+    def receive_item(self, item: int) -> None:
+        self.items.append(item)
+
+
+def read_monkeys(puzzle_input: PuzzleInput) -> Dict[int, Monkey]:
+    monkeys = {}
+    for monkey_lines in records(puzzle_input):
+        number = int(re.match('Monkey (\\d+):', monkey_lines[0]).group(1))
+        items = [int(item) for item in monkey_lines[1][18:].split(', ')]
+        monkeys[number] = Monkey(
+            number=number,
+            items=items,
+            operation=Operation.parse(monkey_lines[2][19:]),
+            test_divisible_by=int(monkey_lines[3][21:]),
+            monkey_if_true=int(monkey_lines[4][29:]),
+            monkey_if_false=int(monkey_lines[5][30:]),
+        )
+    return monkeys
+
+
+def sorted_monkeys(monkeys: Dict[int, Monkey]) -> List[Monkey]:
+    return [monkeys[key] for key in sorted(monkeys.keys())]
+
+
+def combined_modulo(monkeys: Dict[int, Monkey]) -> int:
+    """
+    A modulus that every monkey's test divides, so worry levels can be taken modulo it without changing any test.
+    """
+    return math.prod(monkey.test_divisible_by for monkey in monkeys.values())
+
+
+def play_rounds(monkeys: Dict[int, Monkey], rounds: int, combined_modulo: Optional[int] = None) -> List[int]:
+    """
+    Play the rounds one monkey at a time, giving each monkey's inspect count in order of their numbers.
+    """
+    in_order = sorted_monkeys(monkeys)
+    for _ in range(rounds):
+        for monkey in in_order:
+            monkey.throw_items(monkeys, combined_modulo)
+    return [monkey.inspect_count for monkey in in_order]
+
+
+def monkey_business(inspect_counts: Iterable[int]) -> int:
+    top1, top2 = sorted(inspect_counts)[-2:]
+    return top1 * top2
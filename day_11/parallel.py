@@ -0,0 +1,57 @@
+"""
+Part b's items followed on a pool of worker processes. Items never affect one another, so each worker takes a share of
+the items' starting states, follows each of them through the rounds with day_11.items, and returns the inspect counts
+of its share, which are summed. The monkeys' rules are sent to each worker once, when it starts.
+"""
+
+import concurrent.futures
+import os
+from typing import Dict, List, Optional, Tuple
+
+from day_11 import items
+from day_11.monkeys import Monkey
+
+# Each worker is given several shares, so that a share of slow items doesn't leave the other workers idle at the end
+SHARES_PER_JOB = 4
+
+_rules: List[items.Rule] = []
+
+
+def _attach(rules: List[items.Rule]):
+    _rules[:] = rules
+
+
+def _inspect_share(share: List[Tuple[items.State, int]], rounds: int, combined_modulo: int) -> List[int]:
+    return items.weighted_inspections(_rules, share, rounds, combined_modulo)
+
+
+def shares(states: List[Tuple[items.State, int]], count: int) -> List[List[Tuple[items.State, int]]]:
+    # Dealt out in turn rather than cut into runs, since the states of each monkey's items are next to each other
+    return [share for share in (states[start::count] for start in range(count)) if share]
+
+
+def inspect_counts(
+        monkeys: Dict[int, Monkey],
+        rounds: int,
+        combined_modulo: int,
+        jobs: Optional[int] = None) -> List[int]:
+    """
+    Each monkey's inspect count after the rounds, in order of their numbers, following the items across jobs worker
+    processes, or as many as there are CPUs. With one job the items are followed in this process instead.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        return items.inspect_counts(monkeys, rounds, combined_modulo)
+
+    rules = items.monkey_rules(monkeys)
+    states = list(items.item_states(monkeys, combined_modulo).items())
+    totals = [0] * len(rules)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_attach, initargs=(rules,)) as executor:
+        futures = [
+            executor.submit(_inspect_share, share, rounds, combined_modulo)
+            for share in shares(states, jobs * SHARES_PER_JOB)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            for monkey, count in enumerate(future.result()):
+                totals[monkey] += count
+    return totals
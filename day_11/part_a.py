@@ -1,104 +1,19 @@
 #!/usr/bin/env python3
 
-from __future__ import annotations
 import sys
-from dataclasses import dataclass, field
-from typing import List, Callable
-import re
 
+from aoc.reader import PuzzleInput
+from day_11.monkeys import monkey_business, play_rounds, read_monkeys
 
-@dataclass
-class Monkey:
-    number: int
-    items: List[int]
-    operation: Callable[[int], int]
-    test_divisible_by: int
-    monkey_if_true: int
-    monkey_if_false: int
-    inspect_count: int = field(default_factory=int)
+ROUNDS = 20
 
-    def throw_items(self, monkeys: dict[int, Monkey]) -> int:
-        items = self.items
-        self.items = []
-        self.inspect_count += len(items)
-        for item in items:
-            item = self.operation(item)
-            item = item // 3
-            if item % self.test_divisible_by == 0:
-                monkeys[self.monkey_if_true].receive_item(item)
-            else:
-                monkeys[self.monkey_if_false].receive_item(item)
 
-    def receive_item(self, item: int) -> None:
-        self.items.append(item)
-
-
-def multiply_operation(multiply_value):
-    return lambda old: old * multiply_value
-
-
-def add_operation(add_value):
-    return lambda old: old + add_value
-
-
-def read_monkeys() -> dict[int, Monkey]:
-    monkeys = {}
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        number = int(re.match('Monkey (\\d)+:', line).group(1))
-
-        line = sys.stdin.readline().strip('\n')
-        items = line[18:].split(', ')
-        items = [int(item) for item in items]
-
-        line = sys.stdin.readline().strip('\n')
-        operation_string = line[19:]
-        if operation_string == 'old * old':
-            operation = lambda old: old * old
-        elif operation_string.startswith('old * '):
-            multiply_value = int(operation_string.split(' * ')[1])
-            operation = multiply_operation(multiply_value)
-        else:
-            add_value = int(operation_string.split(' + ')[1])
-            operation = add_operation(add_value)
-
-        line = sys.stdin.readline().strip('\n')
-        test_divisible_by = int(line[21:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkey_if_true = int(line[29:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkey_if_false = int(line[30:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkeys[number] = Monkey(
-            number=number,
-            items=items,
-            operation=operation,
-            test_divisible_by=test_divisible_by,
-            monkey_if_true=monkey_if_true,
-            monkey_if_false=monkey_if_false,
-        )
-
-    return monkeys
+def solve(puzzle_input: PuzzleInput) -> int:
+    return monkey_business(play_rounds(read_monkeys(puzzle_input), ROUNDS))
 
 
 def main():
-    monkeys = read_monkeys()
-
-    sorted_monkeys = [monkeys[key] for key in sorted(monkeys.keys())]
-
-    for _ in range(20):
-        for monkey in sorted_monkeys:
-            monkey.throw_items(monkeys)
-
-    inspect_counts = [monkey.inspect_count for monkey in sorted_monkeys]
-    top1, top2 = sorted(inspect_counts)[-2:]
-    print(top1 * top2)
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
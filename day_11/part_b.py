@@ -1,108 +1,43 @@
 #!/usr/bin/env python3
 
-from __future__ import annotations
-
-import math
 import sys
-from dataclasses import dataclass, field
-from typing import List, Callable
-import re
-
-
-@dataclass
-class Monkey:
-    number: int
-    items: List[int]
-    operation: Callable[[int], int]
-    test_divisible_by: int
-    monkey_if_true: int
-    monkey_if_false: int
-    inspect_count: int = field(default_factory=int)
-
-    def throw_items(self, monkeys: dict[int, Monkey], combined_modulo) -> int:
-        items = self.items
-        self.items = []
-        self.inspect_count += len(items)
-        for item in items:
-            item = self.operation(item)
-            # This is how we keep our numbers reasonably bounded
-            item = item % combined_modulo
-            if item % self.test_divisible_by == 0:
-                monkeys[self.monkey_if_true].receive_item(item)
-            else:
-                monkeys[self.monkey_if_false].receive_item(item)
-
-    def receive_item(self, item: int) -> None:
-        self.items.append(item)
-
-
-def multiply_operation(multiply_value):
-    return lambda old: old * multiply_value
-
-
-def add_operation(add_value):
-    return lambda old: old + add_value
-
-
-def read_monkeys() -> dict[int, Monkey]:
-    monkeys = {}
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
 
-        number = int(re.match('Monkey (\\d)+:', line).group(1))
-
-        line = sys.stdin.readline().strip('\n')
-        items = line[18:].split(', ')
-        items = [int(item) for item in items]
-
-        line = sys.stdin.readline().strip('\n')
-        operation_string = line[19:]
-        if operation_string == 'old * old':
-            operation = lambda old: old * old
-        elif operation_string.startswith('old * '):
-            multiply_value = int(operation_string.split(' * ')[1])
-            operation = multiply_operation(multiply_value)
-        else:
-            add_value = int(operation_string.split(' + ')[1])
-            operation = add_operation(add_value)
-
-        line = sys.stdin.readline().strip('\n')
-        test_divisible_by = int(line[21:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkey_if_true = int(line[29:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkey_if_false = int(line[30:])
-
-        line = sys.stdin.readline().strip('\n')
-        monkeys[number] = Monkey(
-            number=number,
-            items=items,
-            operation=operation,
-            test_divisible_by=test_divisible_by,
-            monkey_if_true=monkey_if_true,
-            monkey_if_false=monkey_if_false,
-        )
-
-    return monkeys
+from aoc.reader import PuzzleInput
+from day_11 import items, parallel
+from day_11.monkeys import combined_modulo, monkey_business, play_rounds, read_monkeys
+
+ROUNDS = 10_000
+
+
+def solve(
+        puzzle_input: PuzzleInput,
+        rounds: int = ROUNDS,
+        per_item: bool = False,
+        vectorised: bool = False,
+        jobs: int = 1) -> int:
+    """
+    With per_item set each item is followed on its own until its state at the start of a round repeats, and its
+    inspections over the rest of the rounds worked out from that cycle, so that any number of rounds takes about as
+    long as the longest cycle. Any jobs other than 1 also follow items on their own, split across jobs worker
+    processes, with jobs=0 using one process per CPU. With vectorised set every round is played on all the items at
+    once with numpy.
+    """
+    monkeys = read_monkeys(puzzle_input)
+    modulo = combined_modulo(monkeys)
+    if vectorised:
+        # Imported here so that solve() works without numpy
+        from day_11 import vectorised as vectorised_rounds
+
+        return monkey_business(vectorised_rounds.inspect_counts(monkeys, rounds, modulo))
+    if jobs != 1:
+        return monkey_business(parallel.inspect_counts(monkeys, rounds, modulo, jobs))
+    if per_item:
+        return monkey_business(items.inspect_counts(monkeys, rounds, modulo))
+    return monkey_business(play_rounds(monkeys, rounds, modulo))
 
 
 def main():
-    monkeys = read_monkeys()
-
-    sorted_monkeys = [monkeys[key] for key in sorted(monkeys.keys())]
-    combined_modulo = math.prod([monkey.test_divisible_by for monkey in sorted_monkeys])
-
-    for _ in range(10_000):
-        for monkey in sorted_monkeys:
-            monkey.throw_items(monkeys, combined_modulo)
-
-    inspect_counts = [monkey.inspect_count for monkey in sorted_monkeys]
-    top1, top2 = sorted(inspect_counts)[-2:]
-    print(top1 * top2)
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,44 @@
+"""
+Day 11's rounds played on every item at once with numpy, which this module needs. Worry levels are held in an int64
+array beside an array of the monkeys holding them, and each monkey's turn is its operation and test applied to the
+items it holds as array operations. Items starting in the same state go the same way, so each state is only held once,
+weighted by its number of items.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from day_11.items import item_states, monkey_rules
+from day_11.monkeys import Monkey
+
+
+def inspect_counts(monkeys: Dict[int, Monkey], rounds: int, combined_modulo: int) -> List[int]:
+    """
+    Each monkey's inspect count after the rounds, in order of their numbers, the same as play_rounds() gives with the
+    combined modulo.
+    """
+    rules = monkey_rules(monkeys)
+    largest_operand = max(
+        [combined_modulo - 1] + [operation.operand for operation, *_ in rules if operation.operand is not None]
+    )
+    if (combined_modulo - 1) * largest_operand > np.iinfo(np.int64).max:
+        raise ValueError(f"Worry levels modulo {combined_modulo} can outgrow int64")
+
+    states = item_states(monkeys, combined_modulo)
+    positions = np.array([position for position, _worry in states], dtype=np.int64)
+    worries = np.array([worry for _position, worry in states], dtype=np.int64)
+    item_counts = np.array(list(states.values()), dtype=np.int64)
+
+    counts = np.zeros(len(rules), dtype=np.int64)
+    for _ in range(rounds):
+        # Items thrown to a later monkey are picked up by its turn in the same round
+        for position, (operation, test_divisible_by, position_if_true, position_if_false) in enumerate(rules):
+            held = np.flatnonzero(positions == position)
+            if not held.size:
+                continue
+            counts[position] += item_counts[held].sum()
+            held_worries = operation(worries[held]) % combined_modulo
+            worries[held] = held_worries
+            positions[held] = np.where(held_worries % test_divisible_by == 0, position_if_true, position_if_false)
+    return counts.tolist()
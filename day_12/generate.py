@@ -0,0 +1,26 @@
+import random
+from string import ascii_lowercase
+
+
+def generate(size: int, seed: int = 0, bump_fraction: float = 0.2) -> str:
+    """
+    A size by size heightmap climbing from S in the top left corner to E in the bottom right. The heights follow a
+    gradient that never rises by more than one between neighbours, with random bumps added away from the top row and
+    right hand column, so that there is always a path along the edge.
+    """
+    rng = random.Random(seed)
+    size = max(size, 14)
+    distance = 2 * size - 2
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            height = (x + y) * 25 // distance
+            if y > 0 and x < size - 1 and rng.random() < bump_fraction:
+                height = min(25, height + rng.randint(1, 3))
+            row.append(ascii_lowercase[height])
+        rows.append(row)
+
+    rows[0][0] = 'S'
+    rows[-1][-1] = 'E'
+    return ''.join(''.join(row) + '\n' for row in rows)
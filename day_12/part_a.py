@@ -5,6 +5,8 @@ import sys
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from aoc.reader import PuzzleInput, lines
+
 
 @dataclass(frozen=True)
 class Vector:
@@ -58,13 +60,9 @@ class Grid:
         return set(neighbours)
 
 
-def read_grid() -> Grid:
+def read_grid(puzzle_input: PuzzleInput) -> Grid:
     grid = []
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
+    for line in lines(puzzle_input):
         grid.append([char for char in line])
 
     starting_position = None
@@ -100,10 +98,14 @@ def find_min_distance_path(grid: Grid):
             return distance
 
 
-def main():
-    grid = read_grid()
+def solve(puzzle_input: PuzzleInput) -> int:
+    grid = read_grid(puzzle_input)
     min_distance = find_min_distance_path(grid)
-    print(min_distance)
+    return min_distance
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
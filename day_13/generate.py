@@ -0,0 +1,20 @@
+import random
+
+
+def random_packet(rng: random.Random, depth: int) -> str:
+    elements = []
+    for _ in range(rng.randint(0, 5)):
+        if depth > 0 and rng.random() < 0.3:
+            elements.append(random_packet(rng, depth - 1))
+        else:
+            elements.append(str(rng.randint(0, 10)))
+    return f"[{','.join(elements)}]"
+
+
+def generate(size: int, seed: int = 0, max_depth: int = 4) -> str:
+    """
+    size pairs of random packets, nested at most max_depth lists deep.
+    """
+    rng = random.Random(seed)
+    pairs = [f"{random_packet(rng, max_depth)}\n{random_packet(rng, max_depth)}\n" for _ in range(size)]
+    return '\n'.join(pairs)
@@ -3,6 +3,8 @@
 import ast
 import sys
 
+from aoc.reader import PuzzleInput, records
+
 
 def normalise(list_left, list_right):
     """
@@ -18,17 +20,10 @@ def normalise(list_left, list_right):
             normalise(list_left[index], list_right[index])
 
 
-def main():
+def solve(puzzle_input: PuzzleInput) -> int:
     index_sum = 0
     index = 1
-    while True:
-        line_left = sys.stdin.readline().strip('\n')
-        if not line_left:
-            break
-
-        line_right = sys.stdin.readline().strip('\n')
-        sys.stdin.readline()
-
+    for line_left, line_right in records(puzzle_input):
         list_left = ast.literal_eval(line_left)
         list_right = ast.literal_eval(line_right)
 
@@ -39,7 +34,11 @@ def main():
 
         index += 1
 
-    print(index_sum)
+    return index_sum
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
@@ -3,6 +3,8 @@
 import ast
 import sys
 
+from aoc.reader import PuzzleInput, lines
+
 FIRST_DIVIDER_PACKET = [[2]]
 SECOND_DIVIDER_PACKET = [[6]]
 
@@ -23,25 +25,19 @@ def normalise(packets):
             normalise(elements)
 
 
-def main():
-    packets = []
-    while True:
-        line = sys.stdin.readline()
-        if line == '':
-            break
-
-        line = line.strip()
-        if not line:
-            continue
-
-        packets.append(ast.literal_eval(line))
+def solve(puzzle_input: PuzzleInput) -> int:
+    packets = [ast.literal_eval(line) for line in lines(puzzle_input) if line]
 
     packets.append(FIRST_DIVIDER_PACKET)
     packets.append(SECOND_DIVIDER_PACKET)
     normalise(packets)
 
     packets.sort()
-    print((packets.index(FIRST_DIVIDER_PACKET) + 1) * (packets.index(SECOND_DIVIDER_PACKET) + 1))
+    return (packets.index(FIRST_DIVIDER_PACKET) + 1) * (packets.index(SECOND_DIVIDER_PACKET) + 1)
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,26 @@
+import random
+from math import isqrt
+
+
+def generate(size: int, seed: int = 0, depth: int = 170) -> str:
+    """
+    size rock paths of two to five points, each segment horizontal or vertical, scattered below the sand source.
+    """
+    rng = random.Random(seed)
+    spread = 20 + 4 * isqrt(size)
+    lines = []
+    for _ in range(size):
+        x = rng.randint(500 - spread, 500 + spread)
+        y = rng.randint(10, depth)
+        points = [(x, y)]
+        horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 4)):
+            length = rng.choice([-1, 1]) * rng.randint(1, 6)
+            if horizontal:
+                x = max(0, x + length)
+            else:
+                y = min(depth, max(10, y + length))
+            points.append((x, y))
+            horizontal = not horizontal
+        lines.append(' -> '.join(f"{x},{y}" for x, y in points))
+    return '\n'.join(lines) + '\n'
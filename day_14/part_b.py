@@ -5,6 +5,8 @@ from collections import defaultdict
 import sys
 from dataclasses import dataclass
 
+from aoc.reader import PuzzleInput, lines
+
 
 @dataclass(frozen=True)
 class Point:
@@ -26,13 +28,9 @@ def parse_point(point: str) -> Point:
     return Point(x=int(x), y=int(y))
 
 
-def read_rock_structures() -> defaultdict(set[int]):
+def read_rock_structures(puzzle_input: PuzzleInput) -> defaultdict(set[int]):
     column_heights = defaultdict(set)
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
+    for line in lines(puzzle_input):
         points = line.split(' -> ')
         points = [parse_point(point) for point in points]
         for from_point, to_point in list(zip(points[:-1], points[1:])):
@@ -56,8 +54,8 @@ def add_floor(column_heights: defaultdict(set[int])):
     column_heights.default_factory = default_with_floor
 
 
-def main():
-    column_heights = read_rock_structures()
+def solve(puzzle_input: PuzzleInput) -> int:
+    column_heights = read_rock_structures(puzzle_input)
     add_floor(column_heights)
 
     sand_units = 0
@@ -91,7 +89,12 @@ def main():
 
         column_heights[x].add(y)
 
-    print(sand_units)
+    return sand_units
+
+
+def main():
+    print(solve(sys.stdin))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,23 @@
+import random
+
+
+def generate(size: int, seed: int = 0, max_coord: int = 4_000_000) -> str:
+    """
+    size sensors within the search area of 0 to max_coord in each axis. A hidden position is chosen, and every
+    sensor's beacon is placed as far away as possible without the sensor covering that position. The hidden position is
+    therefore never covered, though with few sensors other positions may not be covered either.
+    """
+    rng = random.Random(seed)
+    hidden_x, hidden_y = rng.randint(0, max_coord), rng.randint(0, max_coord)
+    lines = []
+    while len(lines) < size:
+        sensor_x, sensor_y = rng.randint(0, max_coord), rng.randint(0, max_coord)
+        beacon_distance = abs(sensor_x - hidden_x) + abs(sensor_y - hidden_y) - 1
+        if beacon_distance < 1:
+            continue
+        x_distance = rng.randint(0, beacon_distance)
+        y_distance = beacon_distance - x_distance
+        beacon_x = sensor_x + rng.choice([-1, 1]) * x_distance
+        beacon_y = sensor_y + rng.choice([-1, 1]) * y_distance
+        lines.append(f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at x={beacon_x}, y={beacon_y}")
+    return '\n'.join(lines) + '\n'
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import itertools
 import sys
-import re
 from dataclasses import dataclass
 from typing import List, Set
 from collections import defaultdict
 
+from aoc.reader import PuzzleInput, lines, match_lines
+
 
 @dataclass(frozen=True)
 class Sensor:
@@ -24,19 +25,14 @@ class Sensor:
         return range(self.x - x_distance, self.x + x_distance + 1)
 
 
-def read_sensors() -> List[Sensor]:
+def read_sensors(puzzle_input: PuzzleInput) -> List[Sensor]:
     sensors = []
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        groups = re.fullmatch(
-            "Sensor at x=(-?\\d+), y=(-?\\d+): closest beacon is at x=(-?\\d+), y=(-?\\d+)",
-            line,
-        ).groups()
-        sensor_x, sensor_y, beacon_x, beacon_y = groups
-        sensor_x, sensor_y, beacon_x, beacon_y = int(sensor_x), int(sensor_y), int(beacon_x), int(beacon_y)
+    sensor_lines = match_lines(
+        "Sensor at x=(-?\\d+), y=(-?\\d+): closest beacon is at x=(-?\\d+), y=(-?\\d+)",
+        lines(puzzle_input),
+        types=int,
+    )
+    for sensor_x, sensor_y, beacon_x, beacon_y in sensor_lines:
         distance = abs(sensor_x - beacon_x) + abs(sensor_y - beacon_y)
         sensors.append(Sensor(sensor_x, sensor_y, beacon_x, beacon_y, distance))
 
@@ -67,10 +63,8 @@ def combine_ranges(ranges: Set[range]):
     return ranges
 
 
-def main():
-    target_y = sys.argv[1]
-    target_y = int(target_y)
-    sensors = read_sensors()
+def solve(puzzle_input: PuzzleInput, target_y: int = 2_000_000) -> int:
+    sensors = read_sensors(puzzle_input)
     beacons_for_y = defaultdict(set[int])
     for sensor in sensors:
         beacons_for_y[sensor.beacon_y].add(sensor.beacon_x)
@@ -81,7 +75,11 @@ def main():
     beacon_point_count = len([x for x in beacons_for_y[target_y] if any([x in r for r in ranges])])
     range_point_count = sum([len(r) for r in ranges])
 
-    print(range_point_count - beacon_point_count)
+    return range_point_count - beacon_point_count
+
+
+def main():
+    print(solve(sys.stdin, target_y=int(sys.argv[1])))
 
 
 if __name__ == '__main__':
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import itertools
 import sys
-import re
 from dataclasses import dataclass
 from typing import List, Set
 from collections import defaultdict
 
+from aoc.reader import PuzzleInput, lines, match_lines
+
 
 @dataclass(frozen=True)
 class Sensor:
@@ -22,19 +23,14 @@ class Sensor:
         return range(self.x - x_distance, self.x + x_distance + 1)
 
 
-def read_sensors() -> List[Sensor]:
+def read_sensors(puzzle_input: PuzzleInput) -> List[Sensor]:
     sensors = []
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        groups = re.fullmatch(
-            "Sensor at x=(-?\\d+), y=(-?\\d+): closest beacon is at x=(-?\\d+), y=(-?\\d+)",
-            line,
-        ).groups()
-        sensor_x, sensor_y, beacon_x, beacon_y = groups
-        sensor_x, sensor_y, beacon_x, beacon_y = int(sensor_x), int(sensor_y), int(beacon_x), int(beacon_y)
+    sensor_lines = match_lines(
+        "Sensor at x=(-?\\d+), y=(-?\\d+): closest beacon is at x=(-?\\d+), y=(-?\\d+)",
+        lines(puzzle_input),
+        types=int,
+    )
+    for sensor_x, sensor_y, beacon_x, beacon_y in sensor_lines:
         distance = abs(sensor_x - beacon_x) + abs(sensor_y - beacon_y)
         sensors.append(Sensor(sensor_x, sensor_y, distance))
 
@@ -65,10 +61,8 @@ def combine_ranges(ranges: Set[range]):
     return ranges
 
 
-def main():
-    max_coord = sys.argv[1]
-    max_coord = int(max_coord)
-    sensors = read_sensors()
+def solve(puzzle_input: PuzzleInput, max_coord: int = 4_000_000) -> int:
+    sensors = read_sensors(puzzle_input)
 
     for y in range(0, max_coord + 1):
         ranges = (sensor.range_for_y(y) for sensor in sensors)
@@ -77,8 +71,11 @@ def main():
 
         range_for_gap = [r for r in ranges if 0 < r.start <= max_coord + 1]
         if any(range_for_gap):
-            print((range_for_gap[0].start - 1) * 4000000 + y)
-            break
+            return (range_for_gap[0].start - 1) * 4000000 + y
+
+
+def main():
+    print(solve(sys.stdin, max_coord=int(sys.argv[1])))
 
 
 if __name__ == '__main__':
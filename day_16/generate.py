@@ -0,0 +1,52 @@
+import random
+from string import ascii_uppercase
+
+
+def valve_name(index: int, width: int) -> str:
+    name = ''
+    for _ in range(width):
+        index, letter = divmod(index, len(ascii_uppercase))
+        name = ascii_uppercase[letter] + name
+    return name
+
+
+def generate(size: int, seed: int = 0, flow_valves: int = 15, extra_tunnels: float = 0.5) -> str:
+    """
+    A connected network of size valves including AA, of which flow_valves have a non-zero flow rate. The network is a
+    random tree with extra_tunnels times size additional tunnels. Valve names get longer than two letters once there
+    are too many valves for two.
+    """
+    rng = random.Random(seed)
+    width = 2
+    while len(ascii_uppercase) ** width < size:
+        width += 1
+    names = [valve_name(index, width) for index in range(size)]
+    rng.shuffle(names)
+    # The solvers start from AA, which also sorts before any longer name. It is the first valve, so never a flow valve.
+    names.remove('A' * width)
+    names.insert(0, 'AA')
+
+    tunnels = [set() for _ in range(size)]
+    for valve in range(1, size):
+        other = rng.randrange(valve)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+    for _ in range(int(size * extra_tunnels)):
+        valve, other = rng.sample(range(size), 2)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+
+    flow_rates = [0] * size
+    for valve in rng.sample(range(1, size), min(flow_valves, size - 1)):
+        flow_rates[valve] = rng.randint(1, 25)
+
+    lines = []
+    for valve in range(size):
+        linked = [names[other] for other in sorted(tunnels[valve])]
+        if len(linked) == 1:
+            lines.append(f"Valve {names[valve]} has flow rate={flow_rates[valve]}; tunnel leads to valve {linked[0]}")
+        else:
+            lines.append(
+                f"Valve {names[valve]} has flow rate={flow_rates[valve]}; tunnels lead to valves {', '.join(linked)}"
+            )
+    return '\n'.join(lines) + '\n'
@@ -5,6 +5,8 @@ import sys
 from dataclasses import dataclass
 from typing import List, Set, Dict
 
+from aoc.reader import PuzzleInput, lines, match_lines
+
 TIME_TO_COMPLETE = 30
 
 
@@ -19,20 +21,15 @@ class Valve:
         return id(self)
 
 
-def read_valves() -> List[Valve]:
+def read_valves(puzzle_input: PuzzleInput) -> List[Valve]:
     valves: Dict[str, Valve] = {}
     valve_linkages: Dict[str, List[str]] = {}
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        groups = re.fullmatch(
-            "Valve ([A-Z]+) has flow rate=(\\d+); tunnels? leads? to valves? ([A-Z, ]+)",
-            line,
-        ).groups()
-        valve_name, flow_rate, linked_valve_names = groups
-        flow_rate = int(flow_rate)
+    valve_lines = match_lines(
+        "Valve ([A-Z]+) has flow rate=(\\d+); tunnels? leads? to valves? ([A-Z, ]+)",
+        lines(puzzle_input),
+        types=(None, int, None),
+    )
+    for valve_name, flow_rate, linked_valve_names in valve_lines:
         linked_valve_names = linked_valve_names.split(', ')
 
         valves[valve_name] = Valve(
@@ -104,8 +101,8 @@ def max_flow_for_given_minute(
     return max_flow_from_this_minute_onward
 
 
-def main():
-    valves = read_valves()
+def solve(puzzle_input: PuzzleInput) -> int:
+    valves = read_valves(puzzle_input)
     populate_flow_valve_distances(set(valves))
     candidate_valves = set(valves[0].valve_time_to_turn_on.keys())
     max_flow_rate = max_flow_for_given_minute(
@@ -114,12 +111,12 @@ def main():
         open_valves=set(),
         minute=1,
     )
-    print(max_flow_rate)
+    return max_flow_rate
 
 
-if __name__ == '__main__':
-    import cProfile
-    import re
+def main():
+    print(solve(sys.stdin))
+
 
-    cProfile.run('main()')
-    # main()
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,8 @@ import itertools
 import sys
 from dataclasses import dataclass
 from typing import List, Set, Dict
-import re
+
+from aoc.reader import PuzzleInput, lines, match_lines
 
 CONCURRENCY = 12
 TIME_TO_COMPLETE = 26
@@ -26,20 +27,15 @@ class Valve:
         return f"Valve(name={self.name})"
 
 
-def read_valves() -> List[Valve]:
+def read_valves(puzzle_input: PuzzleInput) -> List[Valve]:
     valves: Dict[str, Valve] = {}
     valve_linkages: Dict[str, List[str]] = {}
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        groups = re.fullmatch(
-            "Valve ([A-Z]+) has flow rate=(\\d+); tunnels? leads? to valves? ([A-Z, ]+)",
-            line,
-        ).groups()
-        valve_name, flow_rate, linked_valve_names = groups
-        flow_rate = int(flow_rate)
+    valve_lines = match_lines(
+        "Valve ([A-Z]+) has flow rate=(\\d+); tunnels? leads? to valves? ([A-Z, ]+)",
+        lines(puzzle_input),
+        types=(None, int, None),
+    )
+    for valve_name, flow_rate, linked_valve_names in valve_lines:
         linked_valve_names = linked_valve_names.split(', ')
 
         valves[valve_name] = Valve(
@@ -207,8 +203,8 @@ def start_execution(
     )
 
 
-def main():
-    valves = read_valves()
+def solve(puzzle_input: PuzzleInput) -> int:
+    valves = read_valves(puzzle_input)
     populate_valve_time_to_turn_on(set(valves))
     candidate_valves = set(valves[0].valve_time_to_turn_on.keys())
     with concurrent.futures.ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
@@ -221,7 +217,11 @@ def main():
             for human_valve, elephant_valve
             in itertools.combinations(candidate_valves, 2)
         ]
-        print(max([future.result() for future in concurrent.futures.as_completed(futures)]))
+        return max([future.result() for future in concurrent.futures.as_completed(futures)])
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A jet pattern of size pushes.
+    """
+    rng = random.Random(seed)
+    return ''.join(rng.choices('<>', k=size)) + '\n'
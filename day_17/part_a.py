@@ -7,6 +7,8 @@ from dataclasses import field, dataclass
 from typing import List, Set
 from numpy import ubyte, binary_repr
 
+from aoc.reader import PuzzleInput, read_text
+
 LEFT = 0
 RIGHT = 1
 
@@ -76,8 +78,8 @@ def shape_has_no_collisions(grid, grid_height, bottom_of_shape_in_grid, shape_he
     return True
 
 
-def main():
-    line = sys.stdin.readline().strip()
+def solve(puzzle_input: PuzzleInput) -> int:
+    line = read_text(puzzle_input).strip()
     directions = DirectionFactory(directions=[LEFT if char == '<' else RIGHT for char in line])
     shapes = ShapeFactory(shapes=[HORIZONTAL_LINE, CROSS, RIGHT_ANGLE, VERTICAL_LINE, SQUARE])
     grid: List[ubyte] = [ubyte(0b1111111)]
@@ -121,12 +123,12 @@ def main():
 
     y = len(grid) - 1
 
-    print(y)
+    return y
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
@@ -7,6 +7,8 @@ from dataclasses import field, dataclass
 from typing import List, Set
 from numpy import ubyte, binary_repr
 
+from aoc.reader import PuzzleInput, read_text
+
 LEFT = 0
 RIGHT = 1
 
@@ -86,8 +88,8 @@ def attempt_grid_condense(grid):
     return grid
 
 
-def main():
-    line = sys.stdin.readline().strip()
+def solve(puzzle_input: PuzzleInput) -> int:
+    line = read_text(puzzle_input).strip()
     directions = DirectionFactory(directions=[LEFT if char == '<' else RIGHT for char in line])
     shapes = ShapeFactory(shapes=[HORIZONTAL_LINE, CROSS, RIGHT_ANGLE, VERTICAL_LINE, SQUARE])
     previous_added_rows = defaultdict(list)
@@ -152,12 +154,12 @@ def main():
 
         i += 1
 
-    print(top_of_grid)
+    return top_of_grid
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
@@ -0,0 +1,19 @@
+import random
+
+
+def generate(size: int, seed: int = 0, density: float = 0.5) -> str:
+    """
+    size distinct cubes scattered through a cube shaped region, sized so that about density of it is lava. Dense
+    droplets leave plenty of interior air pockets.
+    """
+    rng = random.Random(seed)
+    side = max(2, round((size / density) ** (1 / 3)))
+    while side ** 3 < size:
+        side += 1
+    cubes = rng.sample(range(side ** 3), size)
+    lines = []
+    for cube in cubes:
+        cube, x = divmod(cube, side)
+        z, y = divmod(cube, side)
+        lines.append(f"{x},{y},{z}")
+    return '\n'.join(lines) + '\n'
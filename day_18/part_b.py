@@ -3,18 +3,11 @@
 import sys
 from typing import List, Set, Dict, Tuple
 
+from aoc.reader import PuzzleInput, int_tuples, lines
 
-def read_cubes() -> Set[Tuple[int, int, int]]:
-    cubes: Set[Tuple[int, int, int]] = set()
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
 
-        x, y, z = line.split(',')
-        x, y, z = int(x), int(y), int(z)
-        cubes.add((x, y, z))
-    return cubes
+def read_cubes(puzzle_input: PuzzleInput) -> Set[Tuple[int, int, int]]:
+    return set(int_tuples(lines(puzzle_input)))
 
 
 def cube_neighbours(cube) -> Set[Tuple[int, int, int]]:
@@ -79,19 +72,20 @@ def fill_interior_gaps(cubes):
     return cubes | internal
 
 
-def main():
-    cubes = read_cubes()
+def solve(puzzle_input: PuzzleInput) -> int:
+    cubes = read_cubes(puzzle_input)
     cubes = fill_interior_gaps(cubes)
     exposed_side_count = 0
     for cube in cubes:
         neighbours = cube_neighbours(cube)
         exposed_side_count += len(neighbours - cubes)
 
-    print(exposed_side_count)
+    return exposed_side_count
+
+
+def main():
+    print(solve(sys.stdin))
+
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
@@ -0,0 +1,18 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    size blueprints with robot costs in the same ranges as the real puzzles.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for identifier in range(1, size + 1):
+        lines.append(
+            f"Blueprint {identifier}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian."
+        )
+    return '\n'.join(lines) + '\n'
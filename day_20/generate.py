@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, seed: int = 0, max_value: int = 10_000) -> str:
+    """
+    size numbers between -max_value and max_value, of which exactly one is zero. Other numbers may repeat.
+    """
+    rng = random.Random(seed)
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, max_value) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return ''.join(f"{number}\n" for number in numbers)
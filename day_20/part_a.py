@@ -5,6 +5,8 @@ import sys
 from dataclasses import dataclass
 from typing import List, Set, Dict, Tuple
 
+from aoc.reader import PuzzleInput, ints
+
 
 @dataclass
 class ListNode:
@@ -13,16 +15,12 @@ class ListNode:
     next: ListNode
 
 
-def read_elements() -> Tuple[ListNode, List[ListNode]]:
+def read_elements(puzzle_input: PuzzleInput) -> Tuple[ListNode, List[ListNode]]:
     zero_element: ListNode = None
     previous: ListNode = None
     elements: List[ListNode] = []
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
-        value = int(line) * 811589153
+    for number in ints(puzzle_input):
+        value = number * 811589153
         element = ListNode(
             value,
             previous,
@@ -54,8 +52,8 @@ def print_list(first_element):
             break
 
 
-def main():
-    zero_element, elements = read_elements()
+def solve(puzzle_input: PuzzleInput) -> int:
+    zero_element, elements = read_elements(puzzle_input)
     length_less_one_element = len(elements) - 1
 
     for _ in range(10):
@@ -92,12 +90,12 @@ def main():
         element = element.next
         number_3000 = element.value
 
-    print(number_1000 + number_2000 + number_3000)
+    return number_1000 + number_2000 + number_3000
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
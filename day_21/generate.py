@@ -0,0 +1,77 @@
+import random
+from string import ascii_lowercase
+
+
+def monkey_name(index: int, width: int) -> str:
+    name = ''
+    for _ in range(width):
+        index, letter = divmod(index, len(ascii_lowercase))
+        name = ascii_lowercase[letter] + name
+    return name
+
+
+def split_target(rng: random.Random, target: int) -> (str, int, int):
+    """
+    Pick an operation and two positive operands that give exactly target, so that division is always exact both when
+    evaluating and when solving for the human's number.
+    """
+    if target >= 2 and rng.random() < 0.35:
+        operand_1 = rng.randint(1, target - 1)
+        return '+', operand_1, target - operand_1
+    if rng.random() < 0.5:
+        divisors = [divisor for divisor in range(2, 21) if target % divisor == 0]
+        if divisors:
+            divisor = rng.choice(divisors)
+            return '*', target // divisor, divisor
+    if target < 1_000_000 and rng.random() < 0.5:
+        divisor = rng.randint(2, 5)
+        return '/', target * divisor, divisor
+    subtracted = rng.randint(1, 100)
+    return '-', target + subtracted, subtracted
+
+
+def generate(size: int, seed: int = 0, leaf_child_probability: float = 0.3) -> str:
+    """
+    A tree of about size monkeys under root, with humn as one of the leaves. Both sides of root evaluate to the same
+    number, so the answer to part b is humn's own number. Each operation has a leaf as one operand with probability
+    leaf_child_probability, which makes the tree deeper than a uniformly random one.
+    """
+    rng = random.Random(seed)
+    size = max(size, 3) | 1
+    width = 4
+    while len(ascii_lowercase) ** width < size + 2:
+        width += 1
+    names = [monkey_name(index, width) for index in rng.sample(range(len(ascii_lowercase) ** width), size + 2)]
+    names = [name for name in names if name not in ('root', 'humn')][:size - 1]
+
+    target = rng.randint(1_000, 100_000)
+    root_size_1 = (size - 1) // 2 | 1
+    root_name_1, root_name_2 = names.pop(), names.pop()
+    lines = [f"root: {root_name_1} + {root_name_2}"]
+    leaves = []
+    # Each entry is a monkey's name, the number of monkeys in its subtree, and the number it must yell
+    pending = [(root_name_1, root_size_1, target), (root_name_2, size - 1 - root_size_1, target)]
+
+    while pending:
+        name, subtree_size, target = pending.pop()
+        if subtree_size == 1:
+            leaves.append(len(lines))
+            lines.append(f"{name}: {target}")
+            continue
+
+        if rng.random() < leaf_child_probability:
+            size_1 = rng.choice([1, subtree_size - 2])
+        else:
+            size_1 = rng.randrange(1, subtree_size - 1, 2)
+        operator, operand_1, operand_2 = split_target(rng, target)
+        name_1, name_2 = names.pop(), names.pop()
+        lines.append(f"{name}: {name_1} {operator} {name_2}")
+        pending.append((name_1, size_1, operand_1))
+        pending.append((name_2, subtree_size - 1 - size_1, operand_2))
+
+    human_line = rng.choice(leaves)
+    human_name, human_number = lines[human_line].split(': ')
+    lines[human_line] = f"humn: {human_number}"
+    lines = [line.replace(f" {human_name}", ' humn') if not line.startswith('humn') else line for line in lines]
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
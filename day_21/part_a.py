@@ -7,6 +7,8 @@ import sys
 from dataclasses import dataclass
 from typing import List, Set, Dict, Tuple, Any
 
+from aoc.reader import PuzzleInput, lines
+
 
 @dataclass
 class Node:
@@ -53,14 +55,10 @@ def build_node(nodes, name):
     )
 
 
-def main():
+def solve(puzzle_input: PuzzleInput) -> int:
     nodes: Dict[str, Any] = dict()
 
-    while True:
-        line = sys.stdin.readline().strip('\n')
-        if not line:
-            break
-
+    for line in lines(puzzle_input):
         match = re.fullmatch(
             "([a-z]+): (\\d+)",
             line,
@@ -85,12 +83,12 @@ def main():
         raise ValueError(f"Unexpected line {line}")
 
     root = build_node(nodes, "root")
-    print(root.evaluate())
+    return root.evaluate()
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
@@ -0,0 +1,29 @@
+import random
+from typing import Optional
+
+
+def generate(size: int, seed: int = 0, moves: Optional[int] = None, wall_fraction: float = 0.1) -> str:
+    """
+    A board folded from faces of size by size tiles, laid out in the same cube net as the example, followed by a path
+    of moves steps and turns (10 times size by default).
+    """
+    rng = random.Random(seed)
+    if moves is None:
+        moves = 10 * size
+
+    def tiles(width: int) -> str:
+        return ''.join('#' if rng.random() < wall_fraction else '.' for _ in range(width))
+
+    blank = ' ' * 2 * size
+    board = [blank + tiles(size) for _ in range(size)]
+    board += [tiles(3 * size) for _ in range(size)]
+    board += [blank + tiles(2 * size) for _ in range(size)]
+    # The path starts at the leftmost tile of the top row, which must be open
+    board[0] = blank + '.' + board[0][2 * size + 1:]
+
+    path = [str(rng.randint(1, 2 * size))]
+    for _ in range(moves - 1):
+        path.append(rng.choice('LR'))
+        path.append(str(rng.randint(1, 2 * size)))
+
+    return '\n'.join(board) + '\n\n' + ''.join(path) + '\n'
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Tuple
 
+from aoc.reader import PuzzleInput, records
+
 ROTATION_LOOKUP = {
     'L': -1,
     'R': 1,
@@ -102,28 +104,9 @@ class Board:
             return False
 
 
-def read_board_and_actions() -> Tuple[Board, List[Action]]:
-    board = []
-    actions_str = None
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        line = line.strip('\n')
-        if not line:
-            continue
-
-        print(line)
-        chars = set(list(line))
-        if chars - {' ', '.', '#', }:
-            actions_str = line
-            break
-
-        board.append(line)
-
-    print(board)
-    print(actions_str)
-    print(line)
+def read_board_and_actions(puzzle_input: PuzzleInput) -> Tuple[Board, List[Action]]:
+    board, (actions_str,) = records(puzzle_input)
+
     actions = []
     number = ''
     for char in actions_str:
@@ -140,23 +123,17 @@ def read_board_and_actions() -> Tuple[Board, List[Action]]:
     return Board(board=board), actions
 
 
-def main():
-    board, actions = read_board_and_actions()
-    print(board)
-    print(actions)
+def solve(puzzle_input: PuzzleInput) -> int:
+    board, actions = read_board_and_actions(puzzle_input)
     for action in actions:
-        print(board.x + 1, board.y + 1, board.direction)
         action.perform(board=board)
-        print(action)
-        print(board.x + 1, board.y + 1, board.direction)
-        print()
 
-    print(1000 * (board.y + 1) + 4 * (board.x + 1) + board.direction.value)
+    return 1000 * (board.y + 1) + 4 * (board.x + 1) + board.direction.value
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Tuple
 
+from aoc.reader import PuzzleInput, records
+
 ROTATION_LOOKUP = {
     'L': -1,
     'R': 1,
@@ -135,9 +137,6 @@ class Board:
                     new_y = self.face_size + (self.face_size * 4 - self.x) - 1
                     new_direction = Direction.RIGHT
 
-            print(self.x, self.y)
-            print(new_x, new_y)
-
             if self.char_at(new_x, new_y) == '.':
                 self.x = new_x
                 self.y = new_y
@@ -193,29 +192,9 @@ class Board:
                 print(self.board[y])
 
 
-def read_board_and_actions() -> Tuple[Board, List[Action]]:
-    board = []
-    actions_str = None
-    face_size = None
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        line = line.strip('\n')
-        if not line:
-            continue
-
-        print(line)
-        chars = set(list(line))
-        if chars - {' ', '.', '#', }:
-            actions_str = line
-            break
-
-        board.append(line)
-
-    print(board)
-    print(actions_str)
-    print(line)
+def read_board_and_actions(puzzle_input: PuzzleInput) -> Tuple[Board, List[Action]]:
+    board, (actions_str,) = records(puzzle_input)
+
     actions = []
     number = ''
     for char in actions_str:
@@ -232,23 +211,17 @@ def read_board_and_actions() -> Tuple[Board, List[Action]]:
     return Board(board=board), actions
 
 
-def main():
-    board, actions = read_board_and_actions()
-    print(board)
-    print(actions)
+def solve(puzzle_input: PuzzleInput) -> int:
+    board, actions = read_board_and_actions(puzzle_input)
     for action in actions:
-        print(board.display_board())
-        print()
         action.perform(board=board)
 
-    print(board.display_board())
-    print()
-    print(1000 * (board.y + 1) + 4 * (board.x + 1) + board.direction.value)
+    return 1000 * (board.y + 1) + 4 * (board.x + 1) + board.direction.value
+
+
+def main():
+    print(solve(sys.stdin))
 
 
 if __name__ == '__main__':
-    # import cProfile
-    # import re
-    #
-    # cProfile.run('main()')
     main()
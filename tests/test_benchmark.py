@@ -0,0 +1,14 @@
+from aoc.benchmark import REPO_ROOT, cold_run
+
+LARGE_BUFFER_SIZE = 400 * 1024 * 1024
+
+
+def test_cold_run_peak_rss_excludes_parent():
+    input_path = REPO_ROOT / 'day_05' / 'example.txt'
+    _elapsed, baseline_rss_kb, _output = cold_run('day_05.part_a', input_path, [], timeout=60)
+    # Filled in so that its pages are resident, rather than left to be mapped on first use
+    buffer = b'\x01' * LARGE_BUFFER_SIZE
+    _elapsed, max_rss_kb, output = cold_run('day_05.part_a', input_path, [], timeout=60)
+    assert output == 'CMZ\n'
+    assert max_rss_kb < baseline_rss_kb + LARGE_BUFFER_SIZE // 1024 // 4
+    assert len(buffer) == LARGE_BUFFER_SIZE
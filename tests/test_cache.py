@@ -0,0 +1,31 @@
+from aoc import cache
+from aoc.cache import AnswerCache
+
+
+class CountingCache(AnswerCache):
+    scans = 0
+
+    def scan(self):
+        self.scans += 1
+        return super().scan()
+
+
+def test_puts_rarely_scan(tmp_path):
+    answer_cache = CountingCache(directory=tmp_path, max_bytes=20_000)
+    puts = 5000
+    for number in range(puts):
+        answer_cache.put(f"{number:064x}", {'solver': 'day_05.part_a', 'answer': number, 'seconds': 0.0})
+
+    entry_size = len(list(tmp_path.glob('*.json'))[0].read_bytes())
+    # One scan to start, one for each eviction, which frees at least the writes between evictions, and the rescans
+    writes_per_eviction = int(answer_cache.max_bytes * (1 - cache.EVICTION_TARGET)) // entry_size
+    assert answer_cache.scans <= 1 + puts // writes_per_eviction + puts // cache.RESCAN_INTERVAL
+    assert sum(path.stat().st_size for path in tmp_path.glob('*.json')) <= answer_cache.max_bytes
+
+
+def test_evicts_least_recently_used(tmp_path):
+    answer_cache = AnswerCache(directory=tmp_path, max_bytes=1000)
+    for number in range(100):
+        answer_cache.put(str(number), {'answer': number})
+    assert answer_cache.get('99') == {'answer': 99}
+    assert answer_cache.get('0') is None
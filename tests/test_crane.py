@@ -0,0 +1,72 @@
+import random
+from typing import List
+
+from day_05.crane import Move, operate, plan_top_crates, top_crates
+
+STACK_COUNT = 4
+
+
+def baseline_operate(stacks: List[List[str]], moves: List[Move], keep_order: bool) -> None:
+    """
+    The original solvers' moves: the CrateMover 9000 a crate at a time, and the CrateMover 9001 by slices.
+    """
+    for crate_count, from_stack, to_stack in moves:
+        source, destination = stacks[from_stack - 1], stacks[to_stack - 1]
+        if keep_order:
+            destination.extend(source[-crate_count:])
+            del source[-crate_count:]
+        else:
+            for _ in range(crate_count):
+                destination.append(source.pop())
+
+
+def random_stacks_and_moves(rng: random.Random):
+    crates = iter('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    stacks = [[next(crates) for _ in range(rng.randint(0, 5))] for _ in range(STACK_COUNT)]
+    heights = [len(stack) for stack in stacks]
+    moves = []
+    for _ in range(rng.randint(0, 20)):
+        from_stack = rng.choice([stack for stack in range(STACK_COUNT) if heights[stack]] or [None])
+        if from_stack is None:
+            break
+        # Moves onto the same stack are included
+        to_stack = rng.randrange(STACK_COUNT)
+        crate_count = rng.randint(1, heights[from_stack])
+        heights[from_stack] -= crate_count
+        heights[to_stack] += crate_count
+        moves.append((crate_count, from_stack + 1, to_stack + 1))
+    return stacks, moves
+
+
+def test_operate_matches_baseline():
+    rng = random.Random(0)
+    for _ in range(2000):
+        stacks, moves = random_stacks_and_moves(rng)
+        for keep_order in [False, True]:
+            expected = [list(stack) for stack in stacks]
+            baseline_operate(expected, moves, keep_order)
+            actual = [list(stack) for stack in stacks]
+            operate(actual, moves, keep_order)
+            assert actual == expected, (stacks, moves, keep_order)
+
+
+def test_move_onto_same_stack():
+    for keep_order in [False, True]:
+        stacks = [['A'], ['B', 'C']]
+        operate(stacks, [(2, 2, 2)], keep_order)
+        assert top_crates(stacks) == 'AC'
+
+
+def test_plan_matches_operate():
+    rng = random.Random(1)
+    for _ in range(2000):
+        stacks, moves = random_stacks_and_moves(rng)
+        for keep_order in [False, True]:
+            operated = [list(stack) for stack in stacks]
+            operate(operated, moves, keep_order)
+            assert plan_top_crates(stacks, moves, keep_order) == top_crates(operated), (stacks, moves, keep_order)
+
+
+def test_plan_move_onto_same_stack():
+    for keep_order in [False, True]:
+        assert plan_top_crates([['A'], ['B', 'C']], [(2, 2, 2)], keep_order) == 'AC'
@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from day_08 import part_a, part_b
+
+
+def random_forest(rng: random.Random) -> str:
+    width, height = rng.randint(1, 8), rng.randint(1, 8)
+    return ''.join(''.join(rng.choice('0123456789') for _ in range(width)) + '\n' for _ in range(height))
+
+
+def test_vectorised_matches_grid():
+    rng = random.Random(8)
+    for _ in range(500):
+        forest = random_forest(rng)
+        for part in [part_a, part_b]:
+            assert part.solve(forest, vectorised=True) == part.solve(forest), forest
+
+
+@pytest.mark.parametrize('forest', ['123\n45\n6789\n', '12\n345\n6\n', '123\n4567\n'])
+def test_vectorised_rejects_ragged_rows(forest):
+    for part in [part_a, part_b]:
+        with pytest.raises(ValueError):
+            part.solve(forest, vectorised=True)